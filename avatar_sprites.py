@@ -0,0 +1,113 @@
+import json
+import os
+
+from PIL import Image
+
+# Packs the avatar PNGs in public/profile_pics into one sprite sheet for the
+# avatar picker, plus a tiny WebP per avatar for the header badge.
+#
+#   public/profile_pics/sprite.webp       all avatars in a grid
+#   public/profile_pics/sprite.css        .avatar-sprite / .avatar-{n} classes
+#   public/profile_pics/sprite.json       cell coordinates for each avatar
+#   public/profile_pics/thumbs/{n}.webp   56px thumbnail (28px header badge at 2x)
+avatar_dir = "public/profile_pics"
+thumbs_dir = os.path.join(avatar_dir, "thumbs")
+
+CELL_SIZE = 112   # picker buttons are w-14 (56px); 2x for retina
+THUMB_SIZE = 56
+COLUMNS = 7       # matches the picker's sm:grid-cols-7
+
+
+def find_avatars():
+    numbered = [name for name in os.listdir(avatar_dir) if name.endswith(".png") and name[:-4].isdigit()]
+    return sorted(numbered, key=lambda name: int(name[:-4]))
+
+
+def load_square(path, size):
+    with Image.open(path) as image:
+        image = image.convert("RGBA")
+        # Centre-crop to a square before scaling so nothing gets stretched
+        side = min(image.size)
+        left = (image.width - side) // 2
+        top = (image.height - side) // 2
+        return image.crop((left, top, left + side, top + side)).resize((size, size), Image.Resampling.LANCZOS)
+
+
+def build_sheet(avatars):
+    rows = -(-len(avatars) // COLUMNS)
+    sheet = Image.new("RGBA", (COLUMNS * CELL_SIZE, rows * CELL_SIZE), (0, 0, 0, 0))
+    coordinates = {}
+    for position, file_name in enumerate(avatars):
+        column, row = position % COLUMNS, position // COLUMNS
+        x, y = column * CELL_SIZE, row * CELL_SIZE
+        sheet.paste(load_square(os.path.join(avatar_dir, file_name), CELL_SIZE), (x, y))
+        coordinates[file_name[:-4]] = {"x": x, "y": y, "column": column, "row": row}
+    return sheet, rows, coordinates
+
+
+def build_css(coordinates, rows):
+    # Percent-based positions so the same sprite works at any rendered size
+    lines = [
+        ".avatar-sprite {",
+        "  background-image: url('/profile_pics/sprite.webp');",
+        f"  background-size: {COLUMNS * 100}% {rows * 100}%;",
+        "  background-repeat: no-repeat;",
+        "}",
+    ]
+    for avatar_id, cell in coordinates.items():
+        x = cell["column"] * 100 / (COLUMNS - 1) if COLUMNS > 1 else 0
+        y = cell["row"] * 100 / (rows - 1) if rows > 1 else 0
+        lines.append(f".avatar-{avatar_id} {{ background-position: {x:.4g}% {y:.4g}%; }}")
+    return "\n".join(lines) + "\n"
+
+
+def save(image, path, **options):
+    image.save(path, **options)
+    size = os.path.getsize(path)
+    print(f"   📄 {path} ({size / 1024:.1f} KB)")
+    return size
+
+
+def create_avatar_assets():
+    print("🎨 Building avatar sprite sheet...")
+    avatars = find_avatars()
+    if not avatars:
+        print(f"❌ No numbered avatars found in {avatar_dir}")
+        return
+    source_bytes = sum(os.path.getsize(os.path.join(avatar_dir, name)) for name in avatars)
+
+    sheet, rows, coordinates = build_sheet(avatars)
+    sprite_bytes = save(sheet, os.path.join(avatar_dir, "sprite.webp"), format="WEBP", quality=82, method=6)
+
+    with open(os.path.join(avatar_dir, "sprite.css"), "w", encoding="utf-8") as f:
+        f.write(build_css(coordinates, rows))
+    print(f"   📄 {avatar_dir}/sprite.css")
+
+    sprite_map = {
+        "sprite": "/profile_pics/sprite.webp",
+        "cellSize": CELL_SIZE,
+        "columns": COLUMNS,
+        "rows": rows,
+        "avatars": {
+            avatar_id: {**cell, "thumb": f"/profile_pics/thumbs/{avatar_id}.webp"}
+            for avatar_id, cell in coordinates.items()
+        },
+    }
+    with open(os.path.join(avatar_dir, "sprite.json"), "w", encoding="utf-8") as f:
+        json.dump(sprite_map, f, indent=2)
+    print(f"   📄 {avatar_dir}/sprite.json")
+
+    os.makedirs(thumbs_dir, exist_ok=True)
+    thumb_bytes = 0
+    for file_name in avatars:
+        thumb = load_square(os.path.join(avatar_dir, file_name), THUMB_SIZE)
+        thumb_path = os.path.join(thumbs_dir, f"{file_name[:-4]}.webp")
+        thumb.save(thumb_path, format="WEBP", quality=80, method=6)
+        thumb_bytes += os.path.getsize(thumb_path)
+    print(f"   ✅ {len(avatars)} thumbnails in {thumbs_dir} ({thumb_bytes / 1024:.1f} KB total)")
+
+    print(f"\n✨ Picker: {len(avatars)} PNGs ({source_bytes / 1024:.0f} KB) → 1 sprite ({sprite_bytes / 1024:.0f} KB)")
+
+
+if __name__ == "__main__":
+    create_avatar_assets()
@@ -0,0 +1,46 @@
+import subprocess
+import sys
+import time
+
+# Rebuilds the generated data artifacts from their sources, in dependency order.
+# None of these outputs are committed, so run this after changing
+# data/products.json, data/descriptions/ or public/map_data:
+#
+#   python build_data.py                 every stage
+#   python build_data.py catalog search  only the named stages (still in order)
+#
+# Each stage is its own script (and writes its own build-reports/{name}.json);
+# the first failing stage stops the run.
+STAGES = [
+    ("catalog", ["compile_catalog.py"]),          # data/catalog.compiled.json
+    ("descriptions", ["render_descriptions.py"]),  # data/descriptions.pack
+    ("search", ["search_index.py"]),              # data/search.index (needs catalog)
+    ("snapshots", ["catalog_snapshots.py"]),      # public/snapshots/ (needs catalog)
+    ("geo", ["geo_shards.py"]),                   # public/map_data/geo/
+    ("geo-binary", ["geo_binary.py", "build"]),   # data/geo.bin
+]
+
+
+def main():
+    wanted = sys.argv[1:]
+    unknown = set(wanted) - {name for name, _ in STAGES}
+    if unknown:
+        print(f"❌ Unknown stage(s): {', '.join(sorted(unknown))}. Stages: {', '.join(name for name, _ in STAGES)}")
+        return 2
+
+    started = time.perf_counter()
+    for name, command in STAGES:
+        if wanted and name not in wanted:
+            continue
+        print(f"\n▶️  {name}: python {' '.join(command)}", flush=True)
+        result = subprocess.run([sys.executable, *command])
+        if result.returncode != 0:
+            print(f"\n❌ Stage '{name}' failed (exit {result.returncode}); later stages were not run.")
+            return result.returncode
+
+    print(f"\n✅ Data build finished in {time.perf_counter() - started:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
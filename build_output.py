@@ -0,0 +1,72 @@
+import gzip
+import os
+import tempfile
+from contextlib import contextmanager
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; .gz copies are always written
+    brotli = None
+
+# Shared output helpers for the Python build stages:
+#
+#   atomic_write(path, data)            temp file in the same folder + rename
+#   with atomic_path(path) as tmp: ...  same, for writers that need a file name (Pillow, multi-part)
+#   write_precompressed(path, data)     path plus .gz (and .br when brotli is installed)
+#   chunk_size(count, workers)          ProcessPoolExecutor.map chunksize
+#
+# Readers never see a half-written file: the target is only ever replaced by
+# a complete one.
+
+
+@contextmanager
+def atomic_path(path):
+    # mkstemp gives every writer its own temp name, so parallel workers never
+    # clobber each other's half-written file
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", prefix=".tmp-")
+    os.close(fd)
+    # mkstemp creates 0600 files; these end up served from public/
+    os.chmod(tmp_path, 0o644)
+    try:
+        yield tmp_path
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def atomic_write(path, data):
+    with atomic_path(path) as tmp_path:
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+    return len(data)
+
+
+def compressed_suffixes():
+    return (".gz", ".br") if brotli is not None else (".gz",)
+
+
+def compress(data, suffix):
+    if suffix == ".gz":
+        # mtime=0 keeps the output byte-identical across rebuilds
+        return gzip.compress(data, compresslevel=9, mtime=0)
+    return brotli.compress(data, quality=11)
+
+
+def write_precompressed(path, data):
+    """Write data and its precompressed copies; returns the total bytes written."""
+    written = atomic_write(path, data)
+    for suffix in compressed_suffixes():
+        written += atomic_write(f"{path}{suffix}", compress(data, suffix))
+    return written
+
+
+def warn_if_no_brotli():
+    if brotli is None:
+        print("⚠️ brotli not installed, skipped .br copies (pip install brotli)")
+
+
+def chunk_size(count, workers):
+    # A few chunks per worker keeps the pool busy without paying IPC per item
+    return max(1, count // ((workers or os.cpu_count() or 1) * 4))
@@ -0,0 +1,227 @@
+import cProfile
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+try:
+    import resource
+except ImportError:  # Windows: no rusage, CPU falls back to this process only
+    resource = None
+
+# Shared instrumentation for the Python build stages (scaffold, description
+# generation, catalog compilation, ...).
+#
+#   report = BuildReport("descriptions")
+#   with report.stage("write") as stage:
+#       stage.wrote(path, size)      # or stage.skipped(), stage.read(n), stage.error(msg)
+#   report.finish()
+#
+# Each stage records wall time, CPU time (including finished worker
+# processes), bytes read/written, files rewritten vs skipped, errors and peak
+# RSS. finish() prints a terse summary and writes build-reports/{name}.json.
+#
+# Environment:
+#   BUILD_REPORT_DIR    where JSON reports go (default: build-reports)
+#   BUILD_PROFILE_DIR   if set, every stage is run under cProfile and dumped
+#                       there as {name}.{stage}.prof
+#
+#   python build_profile.py compare old.json new.json   flag stages that got slower
+REPORT_DIR = os.environ.get("BUILD_REPORT_DIR", "build-reports")
+PROFILE_DIR = os.environ.get("BUILD_PROFILE_DIR")
+REGRESSION_THRESHOLD = 0.2  # 20% slower wall time counts as a regression
+REGRESSION_MIN_SECONDS = 0.05  # ignore noise on stages that are fast anyway
+
+
+def cpu_seconds():
+    if resource is None:
+        return time.process_time()
+    own = resource.getrusage(resource.RUSAGE_SELF)
+    children = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return own.ru_utime + own.ru_stime + children.ru_utime + children.ru_stime
+
+
+def reset_peak_rss():
+    # Linux lets us reset the high-water mark, which makes peak RSS per stage
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def peak_rss_bytes():
+    try:
+        with open("/proc/self/status", "r") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS and kilobytes elsewhere
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class Stage:
+    def __init__(self, name):
+        self.name = name
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self.files_written = 0
+        self.files_skipped = 0
+        self.errors = []
+        self.wall = 0.0
+        self.cpu = 0.0
+        self.peak_rss = None
+        self.peak_is_per_stage = False
+
+    def read(self, size):
+        self.bytes_read += size
+
+    def wrote(self, path, size):
+        self.files_written += 1
+        self.bytes_written += size
+
+    def skipped(self, count=1):
+        self.files_skipped += count
+
+    def error(self, message):
+        self.errors.append(str(message))
+
+    def as_dict(self):
+        return {
+            "wall_s": round(self.wall, 6),
+            "cpu_s": round(self.cpu, 6),
+            "bytes_read": self.bytes_read,
+            "bytes_written": self.bytes_written,
+            "files_written": self.files_written,
+            "files_skipped": self.files_skipped,
+            "peak_rss_bytes": self.peak_rss,
+            # False when the OS can't reset the high-water mark, so the value
+            # is the process peak so far rather than this stage's own peak
+            "peak_rss_per_stage": self.peak_is_per_stage,
+            "errors": self.errors,
+        }
+
+
+class BuildReport:
+    def __init__(self, name):
+        self.name = name
+        self.stages = []
+        self.started = time.perf_counter()
+        self.started_cpu = cpu_seconds()
+
+    @contextmanager
+    def stage(self, name):
+        stage = Stage(name)
+        self.stages.append(stage)
+        stage.peak_is_per_stage = reset_peak_rss()
+        profiler = cProfile.Profile() if PROFILE_DIR else None
+        wall_started, cpu_started = time.perf_counter(), cpu_seconds()
+        if profiler:
+            profiler.enable()
+        try:
+            yield stage
+        except Exception as exc:
+            stage.error(f"{type(exc).__name__}: {exc}")
+            raise
+        finally:
+            if profiler:
+                profiler.disable()
+                os.makedirs(PROFILE_DIR, exist_ok=True)
+                profiler.dump_stats(os.path.join(PROFILE_DIR, f"{self.name}.{name}.prof"))
+            stage.wall = time.perf_counter() - wall_started
+            stage.cpu = cpu_seconds() - cpu_started
+            stage.peak_rss = peak_rss_bytes()
+
+    def as_dict(self):
+        return {
+            "name": self.name,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": sys.version.split()[0],
+            "total": {
+                "wall_s": round(time.perf_counter() - self.started, 6),
+                "cpu_s": round(cpu_seconds() - self.started_cpu, 6),
+                "bytes_read": sum(s.bytes_read for s in self.stages),
+                "bytes_written": sum(s.bytes_written for s in self.stages),
+                "files_written": sum(s.files_written for s in self.stages),
+                "files_skipped": sum(s.files_skipped for s in self.stages),
+                "errors": sum(len(s.errors) for s in self.stages),
+            },
+            "stages": {s.name: s.as_dict() for s in self.stages},
+        }
+
+    def summary(self, data=None):
+        data = data or self.as_dict()
+        lines = [f"⏱️  {self.name}:"]
+        for name, s in data["stages"].items():
+            rss = f"{s['peak_rss_bytes'] / 1_048_576:6.1f} MB" if s["peak_rss_bytes"] else "      -"
+            lines.append(
+                f"   {name:<12} {s['wall_s'] * 1000:9.1f} ms wall {s['cpu_s'] * 1000:9.1f} ms cpu  "
+                f"{format_bytes(s['bytes_read']):>9} in {format_bytes(s['bytes_written']):>9} out  "
+                f"{s['files_written']:>6} written {s['files_skipped']:>6} skipped  {rss}"
+                + (f"  ❌ {len(s['errors'])}" if s["errors"] else "")
+            )
+        total = data["total"]
+        lines.append(f"   {'total':<12} {total['wall_s'] * 1000:9.1f} ms wall {total['cpu_s'] * 1000:9.1f} ms cpu")
+        return "\n".join(lines)
+
+    def finish(self, quiet=False):
+        data = self.as_dict()
+        os.makedirs(REPORT_DIR, exist_ok=True)
+        path = os.path.join(REPORT_DIR, f"{self.name}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+        if not quiet:
+            print(self.summary(data))
+            for stage in self.stages:
+                for message in stage.errors:
+                    print(f"   ❌ [{stage.name}] {message}")
+            print(f"   📊 Report: {path}")
+        return data
+
+
+def format_bytes(size):
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024 or unit == "GB":
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+
+
+def compare(before_path, after_path, threshold=REGRESSION_THRESHOLD):
+    with open(before_path, "r", encoding="utf-8") as f:
+        before = json.load(f)
+    with open(after_path, "r", encoding="utf-8") as f:
+        after = json.load(f)
+
+    regressions = 0
+    print(f"📊 {after['name']}: {before['timestamp']} → {after['timestamp']}")
+    for name, new in after["stages"].items():
+        old = before["stages"].get(name)
+        if not old:
+            print(f"   {name:<12} (new stage) {new['wall_s'] * 1000:.1f} ms")
+            continue
+        change = (new["wall_s"] - old["wall_s"]) / old["wall_s"] if old["wall_s"] else 0.0
+        slower = change > threshold and new["wall_s"] - old["wall_s"] > REGRESSION_MIN_SECONDS
+        regressions += slower
+        rss = ""
+        if old["peak_rss_bytes"] and new["peak_rss_bytes"]:
+            rss = f"  rss {(new['peak_rss_bytes'] - old['peak_rss_bytes']) / old['peak_rss_bytes']:+.0%}"
+        print(
+            f"   {'🔺' if slower else '  '} {name:<12} {old['wall_s'] * 1000:9.1f} → {new['wall_s'] * 1000:9.1f} ms "
+            f"({change:+.0%}){rss}"
+        )
+    return regressions
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 4 and sys.argv[1] == "compare":
+        sys.exit(1 if compare(sys.argv[2], sys.argv[3]) else 0)
+    print("Usage: python build_profile.py compare <before.json> <after.json>")
+    sys.exit(2)
@@ -0,0 +1,339 @@
+import argparse
+import csv
+import json
+import os
+import random
+import sys
+import time
+import uuid
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import groupby
+from urllib.error import HTTPError, URLError
+from urllib.parse import urlencode
+from urllib.request import Request, urlopen
+
+from compile_catalog import get_by_id, load_catalog
+
+# Bulk order ingestion and export against the Supabase `orders` table.
+#
+#   python bulk_orders.py import wedding.csv --batch-size 500 --concurrency 4
+#   python bulk_orders.py export --status pending --out pending.jsonl
+#
+# Both directions stream: import reads one order at a time and keeps at most
+# `concurrency` batches in flight; export walks the table with keyset
+# pagination on (created_at, id), so neither side holds the dataset in memory.
+#
+# Every imported order gets a client-side uuid and is inserted with
+# on_conflict=id + ignore-duplicates, so a batch retried after a timeout that
+# had in fact committed is not inserted twice.
+#
+# Import formats (picked by extension):
+#   .jsonl  one order per line: {"user_email", "items": [{"id", "quantity"}], "shipping_address"}
+#   .csv    one item per row, rows of an order grouped by `order_ref`:
+#           order_ref,user_email,product_id,quantity,doorNo,area,landmark,city,state,country,zip
+ADDRESS_FIELDS = ("doorNo", "area", "landmark", "city", "state", "country", "zip")
+EXPORT_CSV_FIELDS = (
+    "order_id", "created_at", "user_email", "status", "total_amount",
+    "product_id", "name", "quantity", *ADDRESS_FIELDS,
+)
+CSV_REQUIRED_FIELDS = ("order_ref", "user_email", "product_id", "quantity")
+RETRYABLE_STATUS = {408, 425, 429, 500, 502, 503, 504}
+INSERT_PREFER = "resolution=ignore-duplicates,return=minimal"
+
+
+class RestError(Exception):
+    pass
+
+
+# --- SUPABASE REST CLIENT (stdlib only) ---
+class SupabaseRest:
+    def __init__(self, url=None, key=None, timeout=30.0, retries=5):
+        self.url = (url or os.environ.get("NEXT_PUBLIC_SUPABASE_URL", "")).rstrip("/")
+        self.key = key or os.environ.get("SUPABASE_SERVICE_ROLE_KEY") or os.environ.get("NEXT_PUBLIC_SUPABASE_ANON_KEY", "")
+        if not self.url:
+            raise RestError("Set NEXT_PUBLIC_SUPABASE_URL (or pass --url)")
+        self.timeout = timeout
+        self.retries = retries
+
+    def request(self, method, table, params=None, body=None, prefer=None):
+        url = f"{self.url}/rest/v1/{table}"
+        if params:
+            url += "?" + urlencode(params)
+        headers = {
+            "apikey": self.key,
+            "Authorization": f"Bearer {self.key}",
+            "Accept": "application/json",
+        }
+        data = None
+        if body is not None:
+            data = json.dumps(body, separators=(",", ":")).encode("utf-8")
+            headers["Content-Type"] = "application/json"
+        if prefer:
+            headers["Prefer"] = prefer
+
+        for attempt in range(self.retries + 1):
+            try:
+                with urlopen(Request(url, data=data, headers=headers, method=method), timeout=self.timeout) as response:
+                    payload = response.read()
+                    return json.loads(payload) if payload else None
+            except HTTPError as error:
+                if error.code not in RETRYABLE_STATUS or attempt == self.retries:
+                    raise RestError(f"{method} {table} failed with {error.code}: {error.read()[:300]!r}") from error
+            except (URLError, TimeoutError, ConnectionError) as error:
+                if attempt == self.retries:
+                    raise RestError(f"{method} {table} failed: {error}") from error
+            # Exponential backoff with full jitter: 0.2s, 0.4s, 0.8s ... capped at 10s
+            time.sleep(random.uniform(0, min(10.0, 0.2 * 2 ** attempt)))
+
+
+# --- IMPORT ---
+# Readers yield (line_number, raw, error); a line that can't be parsed comes
+# through with its source text and an error so it lands in the rejects file.
+def read_jsonl_orders(f):
+    for line_number, line in enumerate(f, start=1):
+        if not line.strip():
+            continue
+        try:
+            raw = json.loads(line)
+        except json.JSONDecodeError as error:
+            yield line_number, line.rstrip("\n"), f"invalid JSON: {error}"
+            continue
+        if isinstance(raw, dict):
+            yield line_number, raw, None
+        else:
+            yield line_number, raw, "expected a JSON object"
+
+
+def read_csv_orders(f):
+    rows = csv.DictReader(f)
+    # Checked once, before anything is read or inserted
+    missing = [field for field in CSV_REQUIRED_FIELDS if field not in (rows.fieldnames or [])]
+    if missing:
+        raise ValueError(f"CSV header is missing column(s): {', '.join(missing)}")
+    return group_csv_rows(rows)
+
+
+def group_csv_rows(rows):
+    # Rows of one order must be adjacent; grouping never looks further ahead
+    for order_ref, group in groupby(enumerate(rows, start=2), key=lambda item: item[1]["order_ref"]):
+        group = list(group)
+        first_line, first = group[0]
+        yield first_line, {
+            "order_ref": order_ref,
+            "user_email": first["user_email"],
+            "items": [{"id": row["product_id"], "quantity": row["quantity"]} for _, row in group],
+            "shipping_address": {field: first.get(field) or "" for field in ADDRESS_FIELDS},
+        }, None
+
+
+def parse_quantity(value):
+    """A real positive integer (not bool), or a string of digits from CSV; None otherwise."""
+    if isinstance(value, str) and value.strip().isascii() and value.strip().isdigit():
+        value = int(value.strip())
+    if isinstance(value, int) and not isinstance(value, bool) and value > 0:
+        return value
+    return None
+
+
+def build_order(catalog, raw):
+    """Validate one raw order and expand it into an `orders` row, or raise ValueError."""
+    email = (raw.get("user_email") or "").strip()
+    if not email:
+        raise ValueError("missing user_email")
+    address = raw.get("shipping_address") or {}
+    if not isinstance(address, dict):
+        raise ValueError("shipping_address must be an object")
+    for field in ("doorNo", "city", "zip"):
+        if not address.get(field):
+            raise ValueError(f"shipping_address.{field} is required")
+    if not raw.get("items"):
+        raise ValueError("order has no items")
+    if not isinstance(raw["items"], list) or not all(isinstance(item, dict) for item in raw["items"]):
+        raise ValueError("items must be a list of {id, quantity} objects")
+
+    items = []
+    total = 0.0
+    for item in raw["items"]:
+        product = get_by_id(catalog, str(item.get("id")))
+        if product is None:
+            raise ValueError(f"unknown product id {item.get('id')!r}")
+        quantity = parse_quantity(item.get("quantity"))
+        if quantity is None:
+            raise ValueError(f"quantity must be a positive whole number, got {item.get('quantity')!r} for product {product['id']}")
+        # Same shape /api/checkout stores today: the CartItem (product + quantity)
+        items.append({**product, "quantity": quantity})
+        total += product["price"] * (1 - product["discount"] / 100) * quantity
+
+    return {
+        "id": str(uuid.uuid4()),
+        "user_email": email,
+        "items": items,
+        "total_amount": round(total, 2),
+        "shipping_address": address,
+        "status": raw.get("status") or "pending",
+    }
+
+
+def iter_batches(orders, size):
+    batch = []
+    for order in orders:
+        batch.append(order)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def import_command(args):
+    client = SupabaseRest(args.url, args.key)
+    catalog = load_catalog()
+    reader = read_csv_orders if args.file.endswith(".csv") else read_jsonl_orders
+    rejects_path = args.rejects or f"{args.file}.rejects.jsonl"
+
+    stats = {"read": 0, "rejected": 0, "inserted": 0, "failed": 0}
+    started = time.perf_counter()
+
+    with open(args.file, "r", encoding="utf-8", newline="") as source:
+        try:
+            raw_orders = reader(source)
+        except ValueError as error:
+            print(f"❌ {args.file}: {error}", file=sys.stderr)
+            return 1
+        with open(rejects_path, "w", encoding="utf-8") as rejects:
+
+            def valid_orders():
+                for line_number, raw, parse_error in raw_orders:
+                    stats["read"] += 1
+                    try:
+                        if parse_error:
+                            raise ValueError(parse_error)
+                        yield build_order(catalog, raw)
+                    except ValueError as error:
+                        stats["rejected"] += 1
+                        rejects.write(json.dumps({"line": line_number, "error": str(error), "order": raw}) + "\n")
+
+            def insert(batch):
+                # Retries are safe: rows already committed by an earlier attempt are skipped by id
+                client.request("POST", "orders", params={"on_conflict": "id"}, body=batch, prefer=INSERT_PREFER)
+                return len(batch)
+
+            # At most `concurrency` batches in flight: submitting waits for a slot,
+            # which in turn throttles how fast the source file is read
+            with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+                in_flight = {}
+                for batch in iter_batches(valid_orders(), args.batch_size):
+                    if len(in_flight) >= args.concurrency:
+                        done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                        collect(done, in_flight, stats)
+                    in_flight[pool.submit(insert, batch)] = len(batch)
+                collect(wait(in_flight).done, in_flight, stats)
+
+    if not stats["rejected"]:
+        os.remove(rejects_path)
+    elapsed = time.perf_counter() - started
+    rate = stats["inserted"] / elapsed if elapsed else 0
+    print(f"✅ Read {stats['read']} orders: {stats['inserted']} inserted, {stats['rejected']} rejected, {stats['failed']} failed")
+    print(f"   {elapsed:.2f}s ({rate:.0f} orders/s, batch {args.batch_size}, concurrency {args.concurrency})")
+    if stats["rejected"]:
+        print(f"   ⚠️ Rejected rows written to {rejects_path}")
+    return 1 if stats["failed"] else 0
+
+
+def collect(done, in_flight, stats):
+    for future in done:
+        size = in_flight.pop(future)
+        try:
+            stats["inserted"] += future.result()
+        except RestError as error:
+            stats["failed"] += size
+            print(f"   ❌ Batch of {size} failed after retries: {error}")
+
+
+# --- EXPORT ---
+def iter_orders(client, page_size, status=None, since=None):
+    """Yield orders oldest first, one page at a time, using (created_at, id) as the cursor."""
+    cursor = None
+    while True:
+        params = [("select", "*"), ("order", "created_at.asc,id.asc"), ("limit", str(page_size))]
+        if status:
+            params.append(("status", f"eq.{status}"))
+        if since:
+            params.append(("created_at", f"gte.{since}"))
+        if cursor:
+            created_at, order_id = cursor
+            params.append(("or", f"(created_at.gt.{created_at},and(created_at.eq.{created_at},id.gt.{order_id}))"))
+
+        page = client.request("GET", "orders", params=params)
+        yield from page
+        if len(page) < page_size:
+            return
+        cursor = (page[-1]["created_at"], page[-1]["id"])
+
+
+def export_command(args):
+    client = SupabaseRest(args.url, args.key)
+    output = open(args.out, "w", encoding="utf-8", newline="") if args.out else sys.stdout
+    as_csv = (args.format or ("csv" if (args.out or "").endswith(".csv") else "jsonl")) == "csv"
+    started = time.perf_counter()
+    count = 0
+    try:
+        writer = csv.DictWriter(output, fieldnames=EXPORT_CSV_FIELDS) if as_csv else None
+        if writer:
+            writer.writeheader()
+        for order in iter_orders(client, args.page_size, args.status, args.since):
+            count += 1
+            if not writer:
+                output.write(json.dumps(order, ensure_ascii=False) + "\n")
+                continue
+            address = order.get("shipping_address") or {}
+            for item in order.get("items") or []:
+                writer.writerow({
+                    "order_id": order["id"],
+                    "created_at": order["created_at"],
+                    "user_email": order["user_email"],
+                    "status": order["status"],
+                    "total_amount": order["total_amount"],
+                    "product_id": item.get("id"),
+                    "name": item.get("name"),
+                    "quantity": item.get("quantity"),
+                    **{field: address.get(field, "") for field in ADDRESS_FIELDS},
+                })
+    finally:
+        if args.out:
+            output.close()
+    print(f"✅ Exported {count} orders in {time.perf_counter() - started:.2f}s", file=sys.stderr)
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk import and export of orders")
+    parser.add_argument("--url", help="Supabase URL (default: $NEXT_PUBLIC_SUPABASE_URL)")
+    parser.add_argument("--key", help="API key (default: $SUPABASE_SERVICE_ROLE_KEY or the anon key)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    importer = commands.add_parser("import", help="stream a CSV/JSONL file into the orders table")
+    importer.add_argument("file")
+    importer.add_argument("--batch-size", type=int, default=500)
+    importer.add_argument("--concurrency", type=int, default=4)
+    importer.add_argument("--rejects", help="where to write invalid rows (default: <file>.rejects.jsonl)")
+    importer.set_defaults(handler=import_command)
+
+    exporter = commands.add_parser("export", help="stream orders out page by page")
+    exporter.add_argument("--out", help="output file (default: stdout)")
+    exporter.add_argument("--format", choices=("jsonl", "csv"), help="default: from --out extension, else jsonl")
+    exporter.add_argument("--page-size", type=int, default=1000)
+    exporter.add_argument("--status", help="only orders with this status")
+    exporter.add_argument("--since", help="only orders created at or after this ISO timestamp")
+    exporter.set_defaults(handler=export_command)
+
+    args = parser.parse_args()
+    try:
+        return args.handler(args)
+    except RestError as error:
+        print(f"❌ {error}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
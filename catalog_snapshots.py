@@ -0,0 +1,132 @@
+import hashlib
+import json
+import os
+import sys
+
+from build_output import atomic_write, compressed_suffixes, warn_if_no_brotli, write_precompressed
+from build_profile import BuildReport
+from compile_catalog import compiled_path, load_catalog, products_path, related_products
+from render_descriptions import descriptions_dir, render_markdown
+
+# Pre-builds everything src/app/product/[id]/page.tsx computes per request into
+# one self-contained JSON payload per product:
+#
+#   public/snapshots/products/{id}.{hash}.json   (+ .gz / .br)
+#   public/snapshots/index.json                  {id: {hash, path, bytes}}
+#
+# The hash covers the payload itself, so a product's URL (and CDN cache key)
+# only changes when something on that product's page changes.
+snapshots_dir = "public/snapshots"
+products_dir = os.path.join(snapshots_dir, "products")
+index_path = os.path.join(snapshots_dir, "index.json")
+
+HASH_LENGTH = 12
+OG_DESCRIPTION_LENGTH = 160
+
+
+def discounted_price(product):
+    # Same formula as the product page
+    return round(product["price"] - product["price"] * (product["discount"] / 100), 2)
+
+
+def card(product):
+    return {
+        "id": product["id"],
+        "name": product["name"],
+        "price": product["price"],
+        "discount": product["discount"],
+        "discountedPrice": discounted_price(product),
+        "availability": product["availability"],
+        "quantityUnit": product["quantityUnit"],
+        "image": product["images"][0] if product["images"] else None,
+    }
+
+
+def load_description(product_id):
+    path = os.path.join(descriptions_dir, f"{product_id}.md")
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return render_markdown(f.read())
+
+
+def build_payload(catalog, product):
+    return {
+        "product": product,
+        "discountedPrice": discounted_price(product),
+        "description": load_description(product["id"]),
+        "related": [card(p) for p in related_products(catalog, product["id"])],
+        "og": {
+            "title": product["name"],
+            "description": product["description"][:OG_DESCRIPTION_LENGTH],
+            "images": product["images"][:1],
+        },
+    }
+
+
+def remove_stale(product_id, keep_digest):
+    prefix = f"{product_id}."
+    for name in os.listdir(products_dir):
+        if name.startswith(prefix) and name.split(".")[1] != keep_digest:
+            os.remove(os.path.join(products_dir, name))
+
+
+def check_catalog_fresh(catalog):
+    with open(products_path, "rb") as f:
+        current = hashlib.sha256(f.read()).hexdigest()
+    if catalog["sourceHash"] != current:
+        raise SystemExit(f"❌ {compiled_path} is older than {products_path}; run compile_catalog.py first")
+
+
+def main():
+    report = BuildReport("snapshots")
+
+    with report.stage("read") as stage:
+        catalog = load_catalog()
+        stage.read(os.path.getsize(compiled_path))
+        check_catalog_fresh(catalog)
+        os.makedirs(products_dir, exist_ok=True)
+        previous = {}
+        if os.path.exists(index_path):
+            stage.read(os.path.getsize(index_path))
+            with open(index_path, "r", encoding="utf-8") as f:
+                previous = json.load(f)
+
+    index = {}
+    written = 0
+    with report.stage("write") as stage:
+        for product in catalog["products"]:
+            product_id = product["id"]
+            data = json.dumps(build_payload(catalog, product), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+            digest = hashlib.sha256(data).hexdigest()[:HASH_LENGTH]
+            path = f"/snapshots/products/{product_id}.{digest}.json"
+            index[product_id] = {"hash": digest, "path": path, "bytes": len(data)}
+
+            file_path = os.path.join(products_dir, f"{product_id}.{digest}.json")
+            # Skip only when the JSON and every precompressed copy are in place,
+            # so a deleted .br (or brotli installed later) gets filled in
+            if previous.get(product_id, {}).get("hash") == digest and all(
+                os.path.exists(f"{file_path}{suffix}") for suffix in ("", *compressed_suffixes())
+            ):
+                stage.skipped()
+                continue
+            stage.wrote(file_path, write_precompressed(file_path, data))
+            remove_stale(product_id, digest)
+            written += 1
+
+    with report.stage("index") as stage:
+        # Products that disappeared from the catalog lose their snapshots too
+        for product_id in previous.keys() - index.keys():
+            remove_stale(product_id, keep_digest=None)
+        stage.wrote(index_path, atomic_write(index_path, json.dumps(index, indent=1, sort_keys=True).encode("utf-8")))
+
+    total_bytes = sum(entry["bytes"] for entry in index.values())
+    warn_if_no_brotli()
+    print(f"✅ {len(index)} product snapshots ({written} rewritten, {len(index) - written} unchanged)")
+    print(f"   {total_bytes / 1024:.1f} KB raw → {index_path}\n")
+    report.finish()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
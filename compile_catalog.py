@@ -0,0 +1,173 @@
+import hashlib
+import json
+import os
+import re
+import sys
+from bisect import bisect_left, bisect_right
+
+from build_output import atomic_write
+from build_profile import BuildReport
+
+# Compiles data/products.json into data/catalog.compiled.json: the products in
+# source order plus a by-id map, inverted category/tag indexes, a price-sorted
+# array for range queries and the related-products list for every id.
+# Index entries are positions into "products", which keeps the file compact.
+products_path = "data/products.json"
+types_path = "src/types/index.ts"
+compiled_path = "data/catalog.compiled.json"
+
+CATALOG_VERSION = 1
+RELATED_LIMIT = 4
+
+INTERFACE_RE = re.compile(r"export interface (\w+)(?: extends \w+)? \{(.*?)\n\}", re.S)
+FIELD_RE = re.compile(r"^\s*(\w+)(\??)\s*:\s*([^;]+);", re.M)
+
+
+# --- SCHEMA (read from the TypeScript source of truth) ---
+def load_interface(name, path=types_path):
+    """Parse the flat fields of a TS interface into {field: (type, optional)}."""
+    with open(path, "r", encoding="utf-8") as f:
+        source = f.read()
+    for match in INTERFACE_RE.finditer(source):
+        if match.group(1) == name:
+            return {
+                field: (ts_type.strip(), optional == "?")
+                for field, optional, ts_type in FIELD_RE.findall(match.group(2))
+            }
+    raise ValueError(f"interface {name} not found in {path}")
+
+
+def check_type(value, ts_type):
+    if ts_type == "string":
+        return isinstance(value, str)
+    if ts_type == "number":
+        return isinstance(value, (int, float)) and not isinstance(value, bool)
+    if ts_type == "boolean":
+        return isinstance(value, bool)
+    if ts_type.endswith("[]"):
+        return isinstance(value, list) and all(check_type(v, ts_type[:-2]) for v in value)
+    if '"' in ts_type or "'" in ts_type:
+        literals = {part.strip().strip("\"'") for part in ts_type.split("|")}
+        return value in literals
+    # Anything more exotic is not used by Product; accept rather than guess
+    return True
+
+
+def validate_products(products, schema):
+    errors = []
+    seen_ids = set()
+    for position, product in enumerate(products):
+        label = f"products[{position}] (id={product.get('id')!r})"
+        for field, (ts_type, optional) in schema.items():
+            if field not in product:
+                if not optional:
+                    errors.append(f"{label}: missing '{field}'")
+            elif not check_type(product[field], ts_type):
+                errors.append(f"{label}: '{field}' should be {ts_type}, got {product[field]!r}")
+        for field in product.keys() - schema.keys():
+            errors.append(f"{label}: unknown field '{field}'")
+
+        if product.get("id") in seen_ids:
+            errors.append(f"{label}: duplicate id")
+        seen_ids.add(product.get("id"))
+        if isinstance(product.get("price"), (int, float)) and product["price"] < 0:
+            errors.append(f"{label}: negative price")
+        if isinstance(product.get("discount"), (int, float)) and not 0 <= product["discount"] <= 100:
+            errors.append(f"{label}: discount must be between 0 and 100")
+    return errors
+
+
+# --- COMPILER ---
+def compile_catalog(products, source_hash):
+    by_id = {p["id"]: i for i, p in enumerate(products)}
+
+    categories = {}
+    tags = {}
+    for i, product in enumerate(products):
+        categories.setdefault(product["category"], []).append(i)
+        for tag in dict.fromkeys(product["tags"]):
+            tags.setdefault(tag, []).append(i)
+
+    price_order = sorted(range(len(products)), key=lambda i: (products[i]["price"], i))
+
+    # Same rule as the product page: same category, not itself, first 4 in source order
+    related = {}
+    for i, product in enumerate(products):
+        siblings = categories[product["category"]]
+        related[product["id"]] = [j for j in siblings[:RELATED_LIMIT + 1] if j != i][:RELATED_LIMIT]
+
+    return {
+        "version": CATALOG_VERSION,
+        "sourceHash": source_hash,
+        "products": products,
+        "byId": by_id,
+        "categories": categories,
+        "tags": tags,
+        "price": {
+            "values": [products[i]["price"] for i in price_order],
+            "order": price_order,
+        },
+        "related": related,
+    }
+
+
+# --- QUERY HELPERS (for the other Python stages) ---
+def load_catalog(path=compiled_path):
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"{path} not found; run compile_catalog.py (or build_data.py) first")
+    with open(path, "r", encoding="utf-8") as f:
+        catalog = json.load(f)
+    if catalog.get("version") != CATALOG_VERSION:
+        raise ValueError(f"{path} is not a v{CATALOG_VERSION} compiled catalog; rerun compile_catalog.py")
+    return catalog
+
+
+def get_by_id(catalog, product_id):
+    position = catalog["byId"].get(product_id)
+    return None if position is None else catalog["products"][position]
+
+
+def in_price_range(catalog, low=float("-inf"), high=float("inf")):
+    values = catalog["price"]["values"]
+    start, end = bisect_left(values, low), bisect_right(values, high)
+    return [catalog["products"][i] for i in catalog["price"]["order"][start:end]]
+
+
+def related_products(catalog, product_id):
+    return [catalog["products"][i] for i in catalog["related"].get(product_id, [])]
+
+
+def main():
+    report = BuildReport("catalog")
+
+    with report.stage("read") as stage:
+        with open(products_path, "rb") as f:
+            raw = f.read()
+        stage.read(len(raw))
+        products = json.loads(raw)
+        source_hash = hashlib.sha256(raw).hexdigest()
+
+    with report.stage("validate") as stage:
+        errors = validate_products(products, load_interface("Product"))
+        for error in errors:
+            stage.error(error)
+    if errors:
+        report.finish()
+        print(f"\n🚫 {len(errors)} validation error(s) in {products_path}; catalog not written.")
+        return 1
+
+    with report.stage("compile"):
+        compiled = json.dumps(compile_catalog(products, source_hash), ensure_ascii=False, separators=(",", ":"))
+
+    with report.stage("write") as stage:
+        data = compiled.encode("utf-8")
+        atomic_write(compiled_path, data)
+        stage.wrote(compiled_path, len(data))
+
+    print(f"✅ Compiled {len(products)} products into {compiled_path} ({len(data)} bytes)\n")
+    report.finish()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,270 @@
+import argparse
+import json
+import re
+import sys
+import time
+from datetime import date
+
+from compile_catalog import get_by_id, load_catalog
+
+# Plans delivery routes for pending orders.
+#
+# Every order line is assigned a delivery window from its product's
+# `availability`: "morning" and "evening" are fixed windows, while "anytime"
+# and "24hr" lines ride along with the order's earliest fixed window (or form
+# an "anytime" stop if the order has none). Stops are then hash-bucketed by
+# (window, city, zip), and each city's zips are packed in PIN order into routes
+# of at most --max-stops stops. Neighbouring PIN codes are neighbouring areas,
+# so a route stays local without any geocoding.
+#
+# Each window's pick list has a line per product plus totals per flower and
+# unit, e.g. 1,560 jasmine stems or 42 m of marigold strings. The amounts come
+# from the count in `quantityUnit` ("10 Stems", "1 Pair", "1.5ft") times the
+# quantity ordered.
+#
+#   python bulk_orders.py export --status pending --out pending.jsonl
+#   python fulfilment_batches.py pending.jsonl --out routes.json
+#   python fulfilment_batches.py --from-supabase --out routes.json
+WINDOW_ORDER = ("morning", "evening", "anytime")
+FLEXIBLE = {"anytime", "24hr"}
+
+UNIT_RE = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([a-z]+)", re.I)
+# quantityUnit word -> (pick unit, multiplier); weights and volumes stay per-SKU only
+PICK_UNITS = {
+    "stem": ("stems", 1), "stems": ("stems", 1),
+    "string": ("strings", 1), "strings": ("strings", 1),
+    "strand": ("strands", 1), "strands": ("strands", 1),
+    "meter": ("m", 1), "meters": ("m", 1), "metre": ("m", 1), "metres": ("m", 1), "ft": ("m", 0.3048),
+    "pc": ("pcs", 1), "pcs": ("pcs", 1), "piece": ("pcs", 1), "pieces": ("pcs", 1), "pair": ("pcs", 2),
+}
+# Flower names as they appear in product names, local names mapped to the English one
+FLOWERS = {
+    "jasmine": "Jasmine", "mullai": "Jasmine", "malli": "Jasmine",
+    "marigold": "Marigold", "genda": "Marigold",
+    "rose": "Rose", "gulab": "Rose",
+    "tuberose": "Tuberose", "rajnigandha": "Tuberose",
+    "lotus": "Lotus", "kamal": "Lotus",
+    "crossandra": "Crossandra", "kanakambaram": "Crossandra",
+    "chrysanthemum": "Chrysanthemum", "sevanthi": "Chrysanthemum",
+    "hibiscus": "Hibiscus", "sembaruthi": "Hibiscus",
+    "nerium": "Nerium", "arali": "Nerium",
+    "areca": "Areca", "pakku": "Areca",
+    "aster": "Aster", "orchid": "Orchid", "carnation": "Carnation", "lily": "Lily", "ixora": "Ixora",
+}
+FLOWER_RE = re.compile(r"\b(" + "|".join(sorted(FLOWERS, key=len, reverse=True)) + r")\b", re.I)
+
+
+def read_orders(path):
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def line_window(catalog, item):
+    product = get_by_id(catalog, str(item.get("id")))
+    availability = (product or item).get("availability", "anytime")
+    return "anytime" if availability in FLEXIBLE else availability
+
+
+def normalise(value):
+    return " ".join(str(value or "").split()).title()
+
+
+def bucket_orders(catalog, orders):
+    """Split orders into stops keyed by (window, city, zip) in one pass."""
+    buckets = {}
+    pick = {window: {} for window in WINDOW_ORDER}
+    counts = {"orders": 0, "skipped": 0}
+
+    for order in orders:
+        if order.get("status", "pending") != "pending":
+            counts["skipped"] += 1
+            continue
+        counts["orders"] += 1
+
+        by_window = {}
+        for item in order.get("items") or []:
+            by_window.setdefault(line_window(catalog, item), []).append(item)
+        flexible = by_window.pop("anytime", [])
+        if by_window:
+            earliest = min(by_window, key=WINDOW_ORDER.index)
+            by_window[earliest].extend(flexible)
+        elif flexible:
+            by_window["anytime"] = flexible
+
+        address = order.get("shipping_address") or {}
+        city = normalise(address.get("city")) or "Unknown"
+        zip_code = str(address.get("zip") or "").strip()
+        for window, items in by_window.items():
+            stop = {
+                "order_id": order.get("id"),
+                "user_email": order.get("user_email"),
+                "address": address,
+                "items": [{"id": item.get("id"), "quantity": item.get("quantity", 1)} for item in items],
+            }
+            buckets.setdefault((window, city, zip_code), []).append(stop)
+
+            window_pick = pick[window]
+            for item in items:
+                product_id = str(item.get("id"))
+                window_pick[product_id] = window_pick.get(product_id, 0) + int(item.get("quantity") or 1)
+
+    return buckets, pick, counts
+
+
+def zip_sort_key(zip_code):
+    return (0, int(zip_code)) if zip_code.isdigit() else (1, zip_code)
+
+
+def build_routes(buckets, max_stops):
+    routes = {window: [] for window in WINDOW_ORDER}
+    by_city = {}
+    for (window, city, zip_code), stops in buckets.items():
+        by_city.setdefault((window, city), []).append((zip_code, stops))
+
+    for (window, city), zips in sorted(by_city.items(), key=lambda kv: (WINDOW_ORDER.index(kv[0][0]), kv[0][1])):
+        current = None
+        for zip_code, stops in sorted(zips, key=lambda z: zip_sort_key(z[0])):
+            # Keep a zip on one route when it fits on a fresh one; only a zip
+            # larger than max_stops is split across routes
+            if current and len(current["stops"]) + len(stops) > max_stops and len(stops) <= max_stops:
+                current = None
+            while stops:
+                if current is None or len(current["stops"]) >= max_stops:
+                    current = {
+                        "route_id": f"{window[:3].upper()}-{city[:3].upper()}-{len(routes[window]) + 1:04d}",
+                        "window": window,
+                        "city": city,
+                        "zips": [],
+                        "stops": [],
+                    }
+                    routes[window].append(current)
+                room = max_stops - len(current["stops"])
+                current["stops"].extend(stops[:room])
+                if zip_code not in current["zips"]:
+                    current["zips"].append(zip_code)
+                stops = stops[room:]
+        # Routes never cross cities
+        current = None
+    return routes
+
+
+def pick_list(catalog, quantities):
+    lines = []
+    for product_id, quantity in quantities.items():
+        product = get_by_id(catalog, product_id) or {}
+        lines.append({
+            "id": product_id,
+            "name": product.get("name", f"Unknown product {product_id}"),
+            "category": product.get("category"),
+            "unit": product.get("quantityUnit"),
+            "quantity": quantity,
+        })
+    return sorted(lines, key=lambda line: (line["category"] or "", -line["quantity"]))
+
+
+def pick_unit(quantity_unit):
+    """"10 Stems" -> ("stems", 10), "1 Pair" -> ("pcs", 2); None for weights, sets, bunches."""
+    match = UNIT_RE.match(quantity_unit or "")
+    if not match or match.group(2).lower() not in PICK_UNITS:
+        return None
+    unit, multiplier = PICK_UNITS[match.group(2).lower()]
+    return unit, float(match.group(1)) * multiplier
+
+
+def flower_name(product):
+    # First flower mentioned wins: "Marigold & Mango Leaf Toran" -> Marigold
+    match = FLOWER_RE.search(product.get("name", ""))
+    return FLOWERS[match.group(1).lower()] if match else product.get("name")
+
+
+def flower_totals(catalog, quantities):
+    totals = {}
+    for product_id, quantity in quantities.items():
+        product = get_by_id(catalog, product_id)
+        parsed = product and pick_unit(product.get("quantityUnit"))
+        if not parsed:
+            continue
+        unit, per_pack = parsed
+        key = (flower_name(product), unit)
+        entry = totals.setdefault(key, {"flower": key[0], "unit": unit, "total": 0, "products": []})
+        entry["total"] += per_pack * quantity
+        entry["products"].append(product_id)
+    for entry in totals.values():
+        entry["total"] = int(entry["total"]) if float(entry["total"]).is_integer() else round(entry["total"], 2)
+    return sorted(totals.values(), key=lambda entry: (entry["flower"], entry["unit"]))
+
+
+def plan(catalog, orders, max_stops, delivery_date):
+    started = time.perf_counter()
+    buckets, pick, counts = bucket_orders(catalog, orders)
+    bucket_time = time.perf_counter() - started
+
+    started = time.perf_counter()
+    routes = build_routes(buckets, max_stops)
+    route_time = time.perf_counter() - started
+
+    windows = {
+        window: {
+            "stops": sum(len(route["stops"]) for route in routes[window]),
+            "pickList": pick_list(catalog, pick[window]),
+            "flowerTotals": flower_totals(catalog, pick[window]),
+            "routes": routes[window],
+        }
+        for window in WINDOW_ORDER
+    }
+    summary = {
+        "date": delivery_date,
+        "orders": counts["orders"],
+        "skipped": counts["skipped"],
+        "buckets": len(buckets),
+        "timings_ms": {"bucket": round(bucket_time * 1000, 2), "route": round(route_time * 1000, 2)},
+    }
+    return {"summary": summary, "windows": windows}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Group pending orders into delivery routes")
+    parser.add_argument("orders", nargs="?", help="JSONL of orders (from bulk_orders.py export)")
+    parser.add_argument("--from-supabase", action="store_true", help="read pending orders straight from Supabase")
+    parser.add_argument("--max-stops", type=int, default=25)
+    parser.add_argument("--date", default=date.today().isoformat(), help="delivery date recorded in the plan")
+    parser.add_argument("--out", help="write the plan here (default: summary only)")
+    args = parser.parse_args()
+
+    if args.from_supabase:
+        from bulk_orders import SupabaseRest, iter_orders
+        orders = iter_orders(SupabaseRest(), page_size=1000, status="pending")
+    elif args.orders:
+        orders = read_orders(args.orders)
+    else:
+        parser.error("pass an orders JSONL file or --from-supabase")
+
+    result = plan(load_catalog(), orders, args.max_stops, args.date)
+    summary = result["summary"]
+    print(f"🚚 {summary['orders']} pending orders → {summary['buckets']} (window, city, zip) buckets")
+    for window, data in result["windows"].items():
+        if data["routes"]:
+            print(f"   {window:<8} {len(data['routes']):>4} routes, {data['stops']:>6} stops, {len(data['pickList'])} products to pick")
+    morning = result["windows"]["morning"]["pickList"]
+    if morning:
+        print("\n🌅 Morning pick:")
+        for line in morning[:15]:
+            print(f"   {line['quantity']:>6} × {line['unit'] or '':<10} {line['name']}")
+        if len(morning) > 15:
+            print(f"   … {len(morning) - 15} more in the plan file")
+        print("\n🌼 Morning totals by flower:")
+        for entry in result["windows"]["morning"]["flowerTotals"]:
+            print(f"   {entry['total']:>8,} {entry['unit']:<8} {entry['flower']}")
+    print(f"\n⏱️  bucket {summary['timings_ms']['bucket']} ms, route {summary['timings_ms']['route']} ms")
+
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=1)
+        print(f"💾 Plan written to {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
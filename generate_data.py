@@ -0,0 +1,261 @@
+import argparse
+import json
+import os
+import random
+import sys
+import time
+import uuid
+
+from supabase_stub import LOADTEST_PASSWORD, LOADTEST_PASSWORD_HASH
+
+# Seeded, reproducible synthetic data for scale testing, in the same shapes as
+# src/types/index.ts:
+#
+#   {out}/products.json            N products (streamed, one at a time)
+#   {out}/descriptions/{id}.md     a long description per product
+#   {out}/categories.json          the category names used
+#   {out}/users.json               M users with addresses from public/map_data
+#
+#   python generate_data.py --products 100000 --users 5000 --out /tmp/scale-data
+#   python generate_data.py --products 100000 --force      (overwrites ./data)
+#
+# Memory stays flat as N grows: nothing is accumulated per product, and the
+# map_data lookups are loaded once.
+#
+# map_data has no city -> state link, so each city is given a home state and
+# PIN prefix from an RNG seeded by (seed, country, city). A city therefore
+# always lands in the same state and PIN range; Indian prefixes follow the
+# real postal circles of the chosen state (Tamil Nadu 60-64, Karnataka 56-59 ...).
+map_data_dir = "public/map_data"
+
+FLOWERS = [
+    ("Jasmine", "Mullai"), ("Marigold", "Genda"), ("Rose", "Gulab"), ("Lotus", "Kamal"),
+    ("Crossandra", "Kanakambaram"), ("Tuberose", "Rajnigandha"), ("Chrysanthemum", "Sevanthi"),
+    ("Hibiscus", "Sembaruthi"), ("Aster", None), ("Orchid", None), ("Carnation", None),
+    ("Lily", None), ("Areca Flower", "Pakku Poo"), ("Nerium", "Arali"), ("Ixora", "Idly Poo"),
+]
+COLOURS = ["Red", "White", "Yellow", "Orange", "Pink", "Purple", "Lavender", "Mixed"]
+
+# form -> (category, units, price range, tags)
+FORMS = {
+    "Garland": ("Wedding Garland", ["1 Pair", "1 Piece", "1 Meter"], (350, 4500), ["garland", "wedding"]),
+    "Loose Flowers": ("Loose Flowers", ["100gms", "250gms", "500gms", "1kg"], (40, 600), ["loose", "daily"]),
+    "Strings": ("Pooja Flowers", ["1 Strand", "10 Strings", "1 Meter"], (30, 400), ["pooja", "strings"]),
+    "Bouquet": ("Bridal Flowers", ["1 Pc"], (450, 3500), ["bouquet", "gift"]),
+    "Petals": ("Decoration", ["250gms", "500gms", "1kg"], (120, 900), ["petals", "decoration"]),
+    "Toran": ("Decoration", ["1 Meter", "2 Meter"], (150, 1200), ["toran", "festival"]),
+    "Gajra": ("Bridal Flowers", ["1 Strand", "2 Strands"], (60, 350), ["gajra", "hair"]),
+    "Stem Bunch": ("Loose Flowers", ["10 Stems", "20 Stems", "50 Stems"], (200, 2500), ["stems", "vase"]),
+    "Pooja Bunch": ("Pooja Flowers", ["1 Bunch", "2 Bunches"], (80, 1800), ["pooja", "traditional"]),
+    "Mandap Kit": ("Wedding Essentials", ["1 Set"], (1500, 12000), ["wedding", "mandap"]),
+}
+AVAILABILITY = (["24hr"] * 4) + (["anytime"] * 3) + (["morning"] * 2) + ["evening"]
+DISCOUNTS = [0, 0, 5, 5, 5, 10, 15, 20]
+PLACEHOLDER_IMAGE = "https://getflowersdaily.com/wp-content/uploads/2025/03/placeholder.jpg"
+
+OCCASIONS = ["Ganapathi Homam", "Varalakshmi Vratham", "housewarming", "wedding receptions",
+             "Navaratri Golu", "temple offerings", "Diwali decorations", "engagement ceremonies"]
+QUALITIES = [
+    "**Hand-Selected:** Only the freshest blooms from the morning harvest are packed.",
+    "**Moisture-Retained:** Wrapped with damp cloth so they arrive looking fresh-cut.",
+    "**Vibrant Colour:** Picked at peak bloom for a deep, even colour.",
+    "**Pesticide-Free:** Sourced from partner farms that avoid chemical sprays.",
+    "**Same-Day Pick:** Harvested, strung and dispatched within hours.",
+    "**Firm Stems:** Sturdy enough for kalasam and mandap decoration.",
+]
+CARE = [
+    "Sprinkle cool water every few hours.",
+    "Keep away from direct sunlight and fans.",
+    "Store wrapped in a wet cotton cloth in the fridge if using the next day.",
+    "Handle gently by the base to avoid bruising the petals.",
+]
+
+FIRST_NAMES = ["Lakshmi", "Arjun", "Priya", "Karthik", "Meena", "Ravi", "Divya", "Suresh", "Anitha",
+               "Vignesh", "Kavya", "Ramesh", "Deepa", "Harish", "Sangeetha", "Pavan", "Swathi", "Naveen"]
+LAST_NAMES = ["Iyer", "Reddy", "Nair", "Kumar", "Rao", "Pillai", "Sharma", "Menon", "Krishnan", "Gowda"]
+AREAS = ["Gandhi Nagar", "Anna Nagar", "Krishna Colony", "Temple Street", "Lake View Road",
+         "MG Road", "Nehru Street", "Railway Colony", "Market Road", "Teachers Colony"]
+LANDMARKS = ["near Ganesh temple", "opp. bus stand", "behind post office", "near water tank", None, None]
+
+# Leading PIN digits per state/UT (postal circles); a city fills in the rest of its 3-digit prefix
+INDIA_PIN_PREFIXES = {
+    "Delhi": ["11"], "Haryana": ["12", "13"], "Punjab": ["14", "15"], "Chandigarh": ["160"],
+    "Himachal Pradesh": ["17"], "Jammu and Kashmir": ["18", "19"], "Ladakh": ["194"],
+    "Uttar Pradesh": ["20", "21", "22", "23", "27", "28"], "Uttarakhand": ["24", "26"],
+    "Rajasthan": ["30", "31", "32", "33", "34"], "Gujarat": ["36", "37", "38", "39"],
+    "Dadra and Nagar Haveli and Daman and Diu": ["396"], "Maharashtra": ["40", "41", "42", "43", "44"],
+    "Goa": ["403"], "Madhya Pradesh": ["45", "46", "47", "48"], "Chhattisgarh": ["49"],
+    "Telangana": ["50"], "Andhra Pradesh": ["51", "52", "53"], "Karnataka": ["56", "57", "58", "59"],
+    "Tamil Nadu": ["60", "61", "62", "63", "64"], "Puducherry": ["605"], "Kerala": ["67", "68", "69"],
+    "Lakshadweep": ["682"], "West Bengal": ["70", "71", "72", "73", "74"], "Sikkim": ["737"],
+    "Andaman and Nicobar Islands": ["744"], "Odisha": ["75", "76", "77"], "Assam": ["78"],
+    "Arunachal Pradesh": ["790", "791", "792"], "Meghalaya": ["793", "794"], "Manipur": ["795"],
+    "Mizoram": ["796"], "Nagaland": ["797", "798"], "Tripura": ["799"],
+    "Bihar": ["80", "84", "85"], "Jharkhand": ["81", "82", "83"],
+}
+
+
+# --- PRODUCTS ---
+def make_product(rng, product_id):
+    flower, local_name = rng.choice(FLOWERS)
+    form = rng.choice(list(FORMS))
+    category, units, (low, high), tags = FORMS[form]
+    colour = rng.choice(COLOURS)
+    name = f"{colour} {flower}{f' ({local_name})' if local_name else ''} {form}"
+    occasion = rng.choice(OCCASIONS)
+    return {
+        "id": str(product_id),
+        "name": name,
+        "category": category,
+        "price": round(rng.uniform(low, high), 2),
+        "discount": rng.choice(DISCOUNTS),
+        "availability": rng.choice(AVAILABILITY),
+        "quantityUnit": rng.choice(units),
+        "images": [PLACEHOLDER_IMAGE],
+        "description": f"Fresh {colour.lower()} {flower.lower()} {form.lower()}, handpicked and perfect for {occasion}.",
+        "tags": [*tags, flower.lower().split()[0], colour.lower()],
+    }, (flower, local_name, occasion)
+
+
+def make_description(rng, product, details):
+    flower, local_name, occasion = details
+    known_as = f", known locally as *{local_name}*," if local_name else ""
+    qualities = "\n".join(f"* {q}" for q in rng.sample(QUALITIES, 3))
+    care = "\n".join(f"{i}.  {step}" for i, step in enumerate(rng.sample(CARE, 3), start=1))
+    return (
+        f"# {product['name']} – Fresh from the Morning Harvest\n\n"
+        f"## Why You'll Love It\n"
+        f"Our {flower.lower()}{known_as} is sourced from trusted growers and prepared fresh "
+        f"for {occasion}. Each order is packed on the day of dispatch.\n\n"
+        f"## The Quality Difference\n{qualities}\n\n"
+        f"## Care Instructions\n{care}\n\n"
+        f"*Bring home the fragrance of tradition.*"
+    )
+
+
+def write_products(rng, out_dir, count, start_id):
+    descriptions_dir = os.path.join(out_dir, "descriptions")
+    os.makedirs(descriptions_dir, exist_ok=True)
+    categories = set()
+    written = 0
+    with open(os.path.join(out_dir, "products.json"), "w", encoding="utf-8") as f:
+        f.write("[\n")
+        for offset in range(count):
+            product, details = make_product(rng, start_id + offset)
+            categories.add(product["category"])
+            f.write(("  " if offset == 0 else ",\n  ") + json.dumps(product, ensure_ascii=False))
+            with open(os.path.join(descriptions_dir, f"{product['id']}.md"), "w", encoding="utf-8") as md:
+                written += md.write(make_description(rng, product, details))
+        f.write("\n]\n")
+    return sorted(categories), written
+
+
+# --- USERS ---
+def load_geo():
+    with open(os.path.join(map_data_dir, "states.json"), "r", encoding="utf-8") as f:
+        states = json.load(f)
+    with open(os.path.join(map_data_dir, "countries+cities.json"), "r", encoding="utf-8") as f:
+        cities = {c["name"]: c["cities"] for c in json.load(f) if c["cities"]}
+    states_by_country = {}
+    for state in states:
+        if state["type"] in (None, "state", "province", "union territory"):
+            states_by_country.setdefault(state["country_name"], []).append(state["name"])
+    # Countries with both states and cities; India dominates like the real customer base
+    countries = sorted(c for c in states_by_country if c in cities)
+    return countries, states_by_country, cities
+
+
+def city_home(seed, states_by_country, homes, country, city):
+    """(state, 3-digit PIN/zip prefix) for a city; the same every time it is picked."""
+    key = (country, city)
+    if key not in homes:
+        home_rng = random.Random(f"{seed}:{country}:{city}")
+        state = home_rng.choice(states_by_country[country])
+        if country == "India":
+            prefix = home_rng.choice(INDIA_PIN_PREFIXES.get(state) or [str(home_rng.randint(11, 85))])
+            prefix += "".join(str(home_rng.randint(0, 9)) for _ in range(3 - len(prefix)))
+        else:
+            prefix = str(home_rng.randint(100, 999))
+        homes[key] = (state, prefix)
+    return homes[key]
+
+
+def make_user(rng, geo, index, seed, homes):
+    countries, states_by_country, cities = geo
+    country = "India" if rng.random() < 0.9 and "India" in cities else rng.choice(countries)
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    city = rng.choice(cities[country])
+    state, prefix = city_home(seed, states_by_country, homes, country, city)
+    # 6-digit PINs in India (a city spans ~100 of them), 5-digit zips elsewhere
+    zip_code = f"{prefix}{rng.randint(1, 99):03d}" if country == "India" else f"{prefix}{rng.randint(0, 99):02d}"
+    address = {
+        "doorNo": f"{rng.randint(1, 40)}-{rng.randint(1, 99)}-{rng.randint(1, 200)}",
+        "area": rng.choice(AREAS),
+        "city": city,
+        "state": state,
+        "country": country,
+        "zip": zip_code,
+    }
+    landmark = rng.choice(LANDMARKS)
+    if landmark:
+        address["landmark"] = landmark
+    return {
+        "id": str(uuid.UUID(int=rng.getrandbits(128), version=4)),
+        "email": f"{first.lower()}.{last.lower()}.{index}@example.com",
+        "password": LOADTEST_PASSWORD_HASH,
+        "name": f"{first} {last}",
+        "role": "customer",
+        "phone": f"{rng.choice('6789')}{rng.randint(0, 999999999):09d}",
+        "address": address,
+        "image": f"/profile_pics/{rng.randint(1, 14)}.png",
+    }
+
+
+def write_users(rng, out_dir, count, seed):
+    geo = load_geo()
+    homes = {}  # bounded by the number of cities in map_data, not by count
+    with open(os.path.join(out_dir, "users.json"), "w", encoding="utf-8") as f:
+        f.write("[\n")
+        for index in range(count):
+            user = make_user(rng, geo, index, seed, homes)
+            f.write(("  " if index == 0 else ",\n  ") + json.dumps(user, ensure_ascii=False))
+        f.write("\n]\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic catalog and users for scale tests")
+    parser.add_argument("--products", type=int, default=10000)
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--start-id", type=int, default=1)
+    parser.add_argument("--out", default="data", help="output folder (default: data)")
+    parser.add_argument("--force", action="store_true", help="allow overwriting an existing products.json")
+    args = parser.parse_args()
+
+    if os.path.exists(os.path.join(args.out, "products.json")) and not args.force:
+        print(f"❌ {args.out}/products.json already exists. Pass --force to overwrite it, or use --out.")
+        return 1
+    os.makedirs(args.out, exist_ok=True)
+
+    # Separate streams so changing --users never changes the generated products
+    product_rng = random.Random(f"{args.seed}:products")
+    user_rng = random.Random(f"{args.seed}:users")
+
+    started = time.perf_counter()
+    categories, description_bytes = write_products(product_rng, args.out, args.products, args.start_id)
+    with open(os.path.join(args.out, "categories.json"), "w", encoding="utf-8") as f:
+        json.dump(categories, f, indent=2)
+    product_time = time.perf_counter() - started
+
+    started = time.perf_counter()
+    write_users(user_rng, args.out, args.users, args.seed)
+    user_time = time.perf_counter() - started
+
+    print(f"✅ {args.products} products + descriptions ({description_bytes / 1_048_576:.1f} MB of markdown) in {product_time:.2f}s")
+    print(f"✅ {args.users} users in {user_time:.2f}s (password: {LOADTEST_PASSWORD})")
+    print(f"📁 Written to {args.out}/ with seed {args.seed}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
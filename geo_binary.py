@@ -0,0 +1,290 @@
+import json
+import mmap
+import os
+import struct
+import sys
+import time
+import unicodedata
+from bisect import bisect_left
+
+from build_output import atomic_path
+from build_profile import BuildReport
+
+# Compact binary copy of the map_data lookups for address validation jobs.
+# The reader mmaps the file and binary-searches fixed-size records, so a
+# country, state or city-prefix lookup touches a few pages instead of parsing
+# 6 MB of JSON.
+#
+#   python geo_binary.py build
+#   python geo_binary.py country IN
+#   python geo_binary.py state India "tamil nadu"
+#   python geo_binary.py cities India chen
+#
+# Layout (little endian):
+#   header    magic, version, then (offset, count) for each section below
+#   strings   UTF-8 string table, referenced as (offset u32, length u16)
+#   countries sorted by folded name: name, folded name, iso2, state range, city range
+#   by_iso2   u16 country indexes sorted by iso2
+#   states    grouped by country, sorted by folded name: name, folded name, code, lat, lon
+#   cities    grouped by country, sorted by folded name: folded name, name
+#
+# "Folded" = casefolded with diacritics stripped, so "São Paulo", "sao paulo"
+# and "SAO PAULO" all resolve to the same record.
+map_data_dir = "public/map_data"
+binary_path = "data/geo.bin"
+
+MAGIC = b"FSGB"
+VERSION = 1
+HEADER = struct.Struct("<4sH2x" + "II" * 5)
+STRING_REF = "IH"
+COUNTRY = struct.Struct("<" + STRING_REF * 2 + "2s" + "II" * 2)
+STATE = struct.Struct("<" + STRING_REF * 3 + "ff")
+CITY = struct.Struct("<" + STRING_REF * 2)
+ISO_INDEX = struct.Struct("<H")
+
+
+def fold(text):
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    return " ".join("".join(ch for ch in decomposed if not unicodedata.combining(ch)).split())
+
+
+# --- WRITER ---
+class StringTable:
+    def __init__(self):
+        self.data = bytearray()
+        self.offsets = {}
+
+    def add(self, text):
+        # Identical strings (most folded names equal their original) are stored once
+        ref = self.offsets.get(text)
+        if ref is None:
+            encoded = text.encode("utf-8")
+            ref = (len(self.data), len(encoded))
+            self.data += encoded
+            self.offsets[text] = ref
+        return ref
+
+
+def load_json(file_name, stage):
+    path = os.path.join(map_data_dir, file_name)
+    stage.read(os.path.getsize(path))
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def build(report, path=binary_path):
+    with report.stage("read") as stage:
+        countries = load_json("countries.json", stage)
+        states_by_country = {}
+        for state in load_json("states.json", stage):
+            states_by_country.setdefault(state["country_code"], []).append(state)
+        cities_by_country = {c["name"]: c["cities"] for c in load_json("countries+cities.json", stage)}
+
+    with report.stage("encode"):
+        sections, counts = encode_sections(countries, states_by_country, cities_by_country)
+
+    with report.stage("write") as stage:
+        offset = HEADER.size
+        layout = []
+        for section, count in zip(sections, counts):
+            layout += [offset, count]
+            offset += len(section)
+        with atomic_path(path) as tmp_path:
+            with open(tmp_path, "wb") as f:
+                f.write(HEADER.pack(MAGIC, VERSION, *layout))
+                for section in sections:
+                    f.write(section)
+        stage.wrote(path, offset)
+    return offset, counts
+
+
+def encode_sections(countries, states_by_country, cities_by_country):
+    strings = StringTable()
+    country_records, state_records, city_records = [], [], []
+
+    for country in sorted(countries, key=lambda c: fold(c["name"])):
+        states = sorted(states_by_country.get(country["iso2"], []), key=lambda s: (fold(s["name"]), s["name"]))
+        state_start = len(state_records)
+        for state in states:
+            state_records.append(STATE.pack(
+                *strings.add(state["name"]), *strings.add(fold(state["name"])), *strings.add(state.get("iso2") or ""),
+                float(state.get("latitude") or 0), float(state.get("longitude") or 0),
+            ))
+
+        names = sorted(set(cities_by_country.get(country["name"], [])), key=lambda n: (fold(n), n))
+        city_start = len(city_records)
+        for name in names:
+            city_records.append(CITY.pack(*strings.add(fold(name)), *strings.add(name)))
+
+        country_records.append((country, COUNTRY.pack(
+            *strings.add(country["name"]), *strings.add(fold(country["name"])), country["iso2"].encode("ascii"),
+            state_start, len(states), city_start, len(names),
+        )))
+
+    by_iso2 = sorted(range(len(country_records)), key=lambda i: country_records[i][0]["iso2"])
+
+    sections = [
+        bytes(strings.data),
+        b"".join(record for _, record in country_records),
+        b"".join(ISO_INDEX.pack(i) for i in by_iso2),
+        b"".join(state_records),
+        b"".join(city_records),
+    ]
+    counts = [len(strings.data), len(country_records), len(by_iso2), len(state_records), len(city_records)]
+    return sections, counts
+
+
+# --- READER ---
+class _Keys:
+    """Sequence view over folded names in a record range, for bisect."""
+
+    def __init__(self, start, count, read_key):
+        self.start, self.count, self.read_key = start, count, read_key
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, i):
+        return self.read_key(self.start + i)
+
+
+class GeoIndex:
+    def __init__(self, path=binary_path):
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, *layout = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a v{VERSION} geo index; run geo_binary.py build")
+        (self._strings, _, self._countries, self.country_count, self._by_iso2, _,
+         self._states, _, self._cities, _) = layout
+
+    def close(self):
+        if getattr(self, "_map", None) is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _string(self, offset, length):
+        start = self._strings + offset
+        return self._map[start:start + length].decode("utf-8")
+
+    def _country(self, i):
+        return COUNTRY.unpack_from(self._map, self._countries + i * COUNTRY.size)
+
+    def _state(self, i):
+        return STATE.unpack_from(self._map, self._states + i * STATE.size)
+
+    def _city(self, i):
+        return CITY.unpack_from(self._map, self._cities + i * CITY.size)
+
+    def _country_dict(self, i):
+        name_off, name_len, _, _, iso2, state_start, state_count, city_start, city_count = self._country(i)
+        return {
+            "index": i,
+            "name": self._string(name_off, name_len),
+            "iso2": iso2.decode("ascii"),
+            "states": state_count,
+            "cities": city_count,
+        }
+
+    def _find_country_index(self, name_or_iso2):
+        if len(name_or_iso2) == 2:
+            code = name_or_iso2.upper().encode("ascii", "ignore")
+            iso_keys = _Keys(0, self.country_count,
+                             lambda j: self._country(ISO_INDEX.unpack_from(self._map, self._by_iso2 + j * 2)[0])[4])
+            j = bisect_left(iso_keys, code)
+            if j < self.country_count and iso_keys[j] == code:
+                return ISO_INDEX.unpack_from(self._map, self._by_iso2 + j * 2)[0]
+        key = fold(name_or_iso2)
+        keys = _Keys(0, self.country_count, lambda i: self._string(*self._country(i)[2:4]))
+        i = bisect_left(keys, key)
+        return i if i < self.country_count and keys[i] == key else None
+
+    def country(self, name_or_iso2):
+        i = self._find_country_index(name_or_iso2)
+        return None if i is None else self._country_dict(i)
+
+    def state(self, country, name_or_code):
+        i = self._find_country_index(country)
+        if i is None:
+            return None
+        _, _, _, _, _, start, count, _, _ = self._country(i)
+        key = fold(name_or_code)
+        keys = _Keys(start, count, lambda j: self._string(*self._state(j)[2:4]))
+        j = bisect_left(keys, key)
+        if j < count and keys[j] == key:
+            return self._state_dict(start + j, i)
+        # Fall back to the state code ("TN"); states per country are few
+        for j in range(start, start + count):
+            record = self._state(j)
+            if record[5] and self._string(*record[4:6]).casefold() == key:
+                return self._state_dict(j, i)
+        return None
+
+    def _state_dict(self, j, country_index):
+        name_off, name_len, _, _, code_off, code_len, lat, lon = self._state(j)
+        return {
+            "name": self._string(name_off, name_len),
+            "code": self._string(code_off, code_len),
+            "country": self._country_dict(country_index)["name"],
+            "latitude": round(lat, 5),
+            "longitude": round(lon, 5),
+        }
+
+    def cities_with_prefix(self, country, prefix, limit=20):
+        i = self._find_country_index(country)
+        if i is None:
+            return []
+        _, _, _, _, _, _, _, start, count = self._country(i)
+        key = fold(prefix)
+        keys = _Keys(start, count, lambda j: self._string(*self._city(j)[0:2]))
+        j = bisect_left(keys, key)
+        matches = []
+        while j < count and len(matches) < limit:
+            record = self._city(start + j)
+            if not self._string(*record[0:2]).startswith(key):
+                break
+            matches.append(self._string(*record[2:4]))
+            j += 1
+        return matches
+
+    def has_city(self, country, name):
+        key = fold(name)
+        return any(fold(city) == key for city in self.cities_with_prefix(country, name, limit=50))
+
+
+def main():
+    command = sys.argv[1] if len(sys.argv) > 1 else "build"
+    if command == "build":
+        report = BuildReport("geo-binary")
+        size, counts = build(report)
+        print(f"✅ {counts[1]} countries, {counts[3]} states, {counts[4]} cities → {binary_path} ({size / 1024:.0f} KB)\n")
+        report.finish()
+        return 0
+
+    with GeoIndex() as geo:
+        started = time.perf_counter()
+        if command == "country" and len(sys.argv) == 3:
+            result = geo.country(sys.argv[2])
+        elif command == "state" and len(sys.argv) == 4:
+            result = geo.state(sys.argv[2], sys.argv[3])
+        elif command == "cities" and len(sys.argv) == 4:
+            result = geo.cities_with_prefix(sys.argv[2], sys.argv[3])
+        else:
+            print("Usage: python geo_binary.py [build | country <name|ISO2> | state <country> <state> | cities <country> <prefix>]")
+            return 2
+        elapsed = (time.perf_counter() - started) * 1_000_000
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+    print(f"⚡ {elapsed:.0f} µs")
+    return 0 if result else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,105 @@
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from build_output import chunk_size, compressed_suffixes, warn_if_no_brotli, write_precompressed
+from build_profile import BuildReport
+
+# Splits the raw public/map_data files into small shards for the address form:
+#   geo/countries.json        slim country list (id, name, iso2, phone code, flag)
+#   geo/states/{ISO2}.json    state names for one country
+#   geo/cities/{ISO2}.json    cities for one country, as [{id, name}]
+# Every shard also gets precompressed .gz (and .br when brotli is installed) copies.
+#
+# The source data only links cities to countries, not to states, so cities are
+# sharded per country: the city step fetches one country's list, never the 4 MB file.
+map_data_dir = "public/map_data"
+output_dir = os.path.join(map_data_dir, "geo")
+
+COUNTRY_FIELDS = ("id", "name", "iso2", "phonecode", "emoji")
+SOURCE_FILES = ("countries.json", "states.json", "countries+cities.json")
+
+
+def load_json(file_name):
+    with open(os.path.join(map_data_dir, file_name), "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def sort_key(name):
+    # Tie-break on the raw name so the order never depends on set/hash order
+    return name.casefold(), name
+
+
+def encode(data):
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def build_shards():
+    countries = load_json("countries.json")
+    states = load_json("states.json")
+    cities_by_country = {c["name"]: c["cities"] for c in load_json("countries+cities.json")}
+
+    shards = {"countries.json": encode([{k: c.get(k) for k in COUNTRY_FIELDS} for c in countries])}
+
+    states_by_code = {}
+    for state in states:
+        states_by_code.setdefault(state["country_code"], []).append(state["name"])
+
+    for country in countries:
+        code = country["iso2"]
+        shards[f"states/{code}.json"] = encode(sorted(states_by_code.get(code, []), key=sort_key))
+        cities = sorted(set(cities_by_country.get(country["name"], [])), key=sort_key)
+        shards[f"cities/{code}.json"] = encode([{"id": i, "name": name} for i, name in enumerate(cities)])
+
+    return shards
+
+
+def is_unchanged(path, data):
+    if not os.path.exists(path) or os.path.getsize(path) != len(data):
+        return False
+    with open(path, "rb") as f:
+        return f.read() == data
+
+
+def write_shard(job):
+    relative_path, data = job
+    path = os.path.join(output_dir, relative_path)
+    # Compression is the expensive part, so an unchanged shard with all of its
+    # copies in place is skipped without recompressing anything
+    if is_unchanged(path, data) and all(os.path.exists(f"{path}{s}") for s in compressed_suffixes()):
+        return relative_path, len(data), 0
+    return relative_path, len(data), write_precompressed(path, data)
+
+
+def main(workers=None):
+    report = BuildReport("geo-shards")
+
+    with report.stage("build") as stage:
+        shards = build_shards()
+        for file_name in SOURCE_FILES:
+            stage.read(os.path.getsize(os.path.join(map_data_dir, file_name)))
+
+    with report.stage("write") as stage:
+        for folder in ("states", "cities"):
+            os.makedirs(os.path.join(output_dir, folder), exist_ok=True)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(write_shard, shards.items(), chunksize=chunk_size(len(shards), workers)))
+        for relative_path, _, written in results:
+            if written:
+                stage.wrote(os.path.join(output_dir, relative_path), written)
+            else:
+                stage.skipped()
+
+    raw_bytes = sum(size for _, size, _ in results)
+    changed = sum(1 for _, _, written in results if written)
+    largest = max(results, key=lambda r: r[1])
+
+    warn_if_no_brotli()
+    print(f"✅ {len(results)} shards in {output_dir} ({changed} changed, {raw_bytes / 1024:.0f} KB raw)")
+    print(f"   largest shard: {largest[0]} ({largest[1] / 1024:.1f} KB)\n")
+    report.finish()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else None)
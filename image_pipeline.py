@@ -0,0 +1,185 @@
+import base64
+import hashlib
+import io
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import unquote, urlparse
+
+from PIL import Image, ImageOps, features
+
+from build_output import atomic_path, atomic_write
+from build_profile import BuildReport
+
+# Turns locally downloaded product photos into responsive WebP/AVIF variants so
+# the shop grid stops hotlinking full-size JPEGs.
+#
+# Sources live in data/images/. Each products.json image URL is matched by its
+# file name (e.g. .../Areca20catechu20flower20_pakku20flower_.jpg), falling back
+# to "{id}-{n}.<ext>" where n is the image's position in the product's list.
+# Variants go to public/images/products/{id}/{n}-{width}.{format} and are
+# recorded in data/images.manifest.json, keyed by product id.
+source_dir = "data/images"
+output_dir = "public/images/products"
+manifest_path = "data/images.manifest.json"
+products_path = "data/products.json"
+
+WIDTHS = (320, 640, 960, 1280)
+SAVE_OPTIONS = {"webp": {"quality": 78, "method": 6}, "avif": {"quality": 55}}
+PLACEHOLDER_WIDTH = 16
+SOURCE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".webp", ".avif")
+
+
+def output_formats():
+    # AVIF needs a Pillow build with libavif; WebP is always produced
+    return ["webp", "avif"] if features.check("avif") else ["webp"]
+
+
+def file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def find_source(product_id, index, url, available):
+    name = os.path.basename(unquote(urlparse(url).path))
+    if name in available:
+        return name
+    for ext in SOURCE_EXTENSIONS:
+        candidate = f"{product_id}-{index}{ext}"
+        if candidate in available:
+            return candidate
+    return None
+
+
+def variant_widths(source_width):
+    # Never upscale; a small source still gets one variant at its own width
+    widths = [w for w in WIDTHS if w <= source_width]
+    return widths or [source_width]
+
+
+def blur_placeholder(image):
+    height = max(1, round(image.height * PLACEHOLDER_WIDTH / image.width))
+    tiny = image.resize((PLACEHOLDER_WIDTH, height), Image.Resampling.BILINEAR)
+    buffer = io.BytesIO()
+    tiny.save(buffer, "WEBP", quality=40)
+    return "data:image/webp;base64," + base64.b64encode(buffer.getvalue()).decode("ascii")
+
+
+def process_image(job):
+    product_id, index, source_name, digest, formats = job
+    with Image.open(os.path.join(source_dir, source_name)) as opened:
+        image = ImageOps.exif_transpose(opened)
+        image = image.convert("RGBA" if image.mode in ("RGBA", "LA", "P") else "RGB")
+
+    folder = os.path.join(output_dir, product_id)
+    os.makedirs(folder, exist_ok=True)
+
+    variants = []
+    bytes_written = 0
+    for width in variant_widths(image.width):
+        height = round(image.height * width / image.width)
+        resized = image if width == image.width else image.resize((width, height), Image.Resampling.LANCZOS)
+        for fmt in formats:
+            file_name = f"{index}-{width}.{fmt}"
+            path = os.path.join(folder, file_name)
+            with atomic_path(path) as tmp_path:
+                resized.save(tmp_path, fmt.upper(), **SAVE_OPTIONS[fmt])
+            size = os.path.getsize(path)
+            bytes_written += size
+            variants.append({
+                "src": f"/images/products/{product_id}/{file_name}",
+                "format": fmt,
+                "width": width,
+                "height": height,
+                "bytes": size,
+            })
+
+    entry = {
+        "source": source_name,
+        "hash": digest,
+        "width": image.width,
+        "height": image.height,
+        "blurDataURL": blur_placeholder(image),
+        "variants": variants,
+    }
+    return product_id, index, entry, bytes_written
+
+
+def is_fresh(entry, digest, formats):
+    if not entry or entry.get("hash") != digest:
+        return False
+    produced = {v["format"] for v in entry["variants"]}
+    if not set(formats) <= produced:
+        return False
+    return all(os.path.exists(os.path.join("public", v["src"].lstrip("/"))) for v in entry["variants"])
+
+
+def load_manifest():
+    if not os.path.exists(manifest_path):
+        return {}
+    with open(manifest_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def main(workers=None):
+    if not os.path.isdir(source_dir):
+        print(f"❌ No source folder at {source_dir}. Download the product photos there first.")
+        return 1
+    report = BuildReport("images")
+
+    with report.stage("scan") as stage:
+        with open(products_path, "r", encoding="utf-8") as f:
+            products = json.load(f)
+        available = set(os.listdir(source_dir))
+        formats = output_formats()
+        previous = load_manifest()
+
+        manifest = {}
+        jobs = []
+        missing = []
+        for product in products:
+            product_id = product["id"]
+            old_entries = previous.get(product_id, [])
+            entries = manifest.setdefault(product_id, [None] * len(product["images"]))
+            for index, url in enumerate(product["images"]):
+                source_name = find_source(product_id, index, url, available)
+                if source_name is None:
+                    missing.append(f"{product_id}[{index}] {url}")
+                    continue
+                source_path = os.path.join(source_dir, source_name)
+                digest = file_hash(source_path)
+                stage.read(os.path.getsize(source_path))
+                old = old_entries[index] if index < len(old_entries) else None
+                if is_fresh(old, digest, formats):
+                    entries[index] = old
+                    stage.skipped()
+                else:
+                    jobs.append((product_id, index, source_name, digest, formats))
+
+    with report.stage("encode") as stage:
+        if jobs:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                for product_id, index, entry, written in pool.map(process_image, jobs):
+                    manifest[product_id][index] = entry
+                    stage.wrote(os.path.join(output_dir, product_id), written)
+                    print(f"   🖼️  {product_id}[{index}] → {len(entry['variants'])} variants")
+
+    with report.stage("manifest") as stage:
+        stage.wrote(manifest_path, atomic_write(manifest_path, json.dumps(manifest, indent=2).encode("utf-8")))
+
+    for item in missing:
+        print(f"   ⚠️ No local source for {item}")
+    if "avif" not in formats:
+        print("   ⚠️ This Pillow build has no AVIF support; wrote WebP only")
+    total = sum(len(entries) for entries in manifest.values())
+    print(f"\n✅ {len(jobs)} image(s) encoded, {total - len(jobs) - len(missing)} unchanged, {len(missing)} missing\n")
+    report.finish()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(int(sys.argv[1]) if len(sys.argv) > 1 else None))
@@ -0,0 +1,294 @@
+import argparse
+import asyncio
+import json
+import random
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from urllib.parse import urlsplit
+
+from supabase_stub import LOADTEST_PASSWORD
+
+# Open-loop load generator for the login, checkout and orders API routes.
+# Requests are scheduled at a fixed rate and latency is measured from each
+# request's *scheduled* start, so a slow server can't hide queueing delay
+# (no coordinated omission).
+#
+#   python supabase_stub.py --latency-ms 40 &
+#   NEXT_PUBLIC_SUPABASE_URL=http://127.0.0.1:54321 NEXT_PUBLIC_SUPABASE_ANON_KEY=stub npm run start &
+#   python loadtest.py run --rps 50 --duration 30 --out results.json
+#   python loadtest.py compare before.json after.json
+
+DEFAULT_MIX = "login=1,checkout=2,orders=4"
+PERCENTILES = (50, 95, 99)
+
+CHECKOUT_ITEMS = [
+    {"id": "6", "name": "Jasmine (Mullai) Guest Garland", "price": 450, "discount": 5, "quantity": 2},
+    {"id": "9", "name": "Yellow & Orange Marigold Strings", "price": 150, "discount": 5, "quantity": 5},
+]
+
+
+# --- MINIMAL ASYNC HTTP/1.1 CLIENT (stdlib only) ---
+async def read_body(reader, headers):
+    if headers.get("transfer-encoding", "").lower() == "chunked":
+        chunks = []
+        while True:
+            size = int((await reader.readline()).split(b";")[0].strip() or b"0", 16)
+            if size == 0:
+                await reader.readline()
+                break
+            chunks.append(await reader.readexactly(size))
+            await reader.readline()
+        return b"".join(chunks)
+    length = headers.get("content-length")
+    if length is not None:
+        return await reader.readexactly(int(length))
+    return await reader.read()
+
+
+async def http_request(host, port, method, path, body=None, cookie=None, timeout=30.0):
+    payload = b"" if body is None else json.dumps(body).encode("utf-8")
+    lines = [
+        f"{method} {path} HTTP/1.1",
+        f"Host: {host}:{port}",
+        "Connection: close",
+        "Accept: application/json",
+        f"Content-Length: {len(payload)}",
+    ]
+    if body is not None:
+        lines.append("Content-Type: application/json")
+    if cookie:
+        lines.append(f"Cookie: {cookie}")
+
+    async def exchange():
+        reader, writer = await asyncio.open_connection(host, port)
+        try:
+            writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + payload)
+            await writer.drain()
+            status = int((await reader.readline()).split()[1])
+            headers = {}
+            set_cookies = []
+            while True:
+                line = (await reader.readline()).decode("latin-1").rstrip("\r\n")
+                if not line:
+                    break
+                name, _, value = line.partition(":")
+                name = name.strip().lower()
+                headers[name] = value.strip()
+                if name == "set-cookie":
+                    set_cookies.append(value.strip())
+            data = await read_body(reader, headers)
+            return status, set_cookies, data
+        finally:
+            writer.close()
+
+    return await asyncio.wait_for(exchange(), timeout)
+
+
+# --- SCENARIO ---
+class Session:
+    def __init__(self, email):
+        self.email = email
+        self.cookie = None
+
+
+class LoadTest:
+    def __init__(self, base_url, users, mix):
+        parts = urlsplit(base_url)
+        self.host = parts.hostname
+        self.port = parts.port or 80
+        self.sessions = [Session(f"loadtest+{i}@example.com") for i in range(users)]
+        self.mix = mix
+        self.samples = {name: [] for name in mix}
+        self.errors = {name: 0 for name in mix}
+
+    async def login(self, session):
+        status, cookies, _ = await http_request(
+            self.host, self.port, "POST", "/api/auth/login",
+            {"email": session.email, "password": LOADTEST_PASSWORD},
+        )
+        for cookie in cookies:
+            if cookie.startswith("token="):
+                session.cookie = cookie.split(";", 1)[0]
+        return status
+
+    async def checkout(self, session):
+        total = sum(i["price"] * (1 - i["discount"] / 100) * i["quantity"] for i in CHECKOUT_ITEMS)
+        status, _, _ = await http_request(
+            self.host, self.port, "POST", "/api/checkout",
+            {"items": CHECKOUT_ITEMS, "totalAmount": round(total, 2)}, cookie=session.cookie,
+        )
+        return status
+
+    async def orders(self, session):
+        status, _, _ = await http_request(self.host, self.port, "GET", "/api/orders", cookie=session.cookie)
+        return status
+
+    async def warm_up(self):
+        statuses = await asyncio.gather(*(self.login(s) for s in self.sessions), return_exceptions=True)
+        failed = sum(1 for s in statuses if s != 200)
+        if failed:
+            raise RuntimeError(f"{failed}/{len(self.sessions)} warm-up logins failed; is the app pointed at the stub?")
+
+    async def fire(self, name, scheduled):
+        session = random.choice(self.sessions)
+        try:
+            status = await getattr(self, name)(session)
+            ok = 200 <= status < 300
+        except (OSError, EOFError, asyncio.TimeoutError, ValueError, IndexError):
+            # EOFError covers asyncio.IncompleteReadError: the server closed mid-body
+            ok = False
+        latency = time.perf_counter() - scheduled
+        if ok:
+            self.samples[name].append(latency)
+        else:
+            self.errors[name] += 1
+
+    async def run(self, rps, duration):
+        names = list(self.mix)
+        weights = [self.mix[n] for n in names]
+        total = int(rps * duration)
+        tasks = []
+        started = time.perf_counter()
+        for i in range(total):
+            scheduled = started + i / rps
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            tasks.append(asyncio.ensure_future(self.fire(random.choices(names, weights)[0], scheduled)))
+        await asyncio.gather(*tasks)
+        return time.perf_counter() - started
+
+
+# --- REPORTING ---
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return None
+    rank = max(0, min(len(sorted_values) - 1, round(pct / 100 * len(sorted_values) + 0.5) - 1))
+    return sorted_values[rank]
+
+
+def summarize(samples, errors, elapsed):
+    ordered = sorted(samples)
+    stats = {
+        "count": len(ordered),
+        "errors": errors,
+        "throughput_rps": round(len(ordered) / elapsed, 2) if elapsed else 0.0,
+        "mean_ms": round(sum(ordered) / len(ordered) * 1000, 2) if ordered else None,
+        "max_ms": round(ordered[-1] * 1000, 2) if ordered else None,
+    }
+    for pct in PERCENTILES:
+        value = percentile(ordered, pct)
+        stats[f"p{pct}_ms"] = None if value is None else round(value * 1000, 2)
+    return stats
+
+
+def git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def parse_mix(text):
+    mix = {}
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        if name not in ("login", "checkout", "orders"):
+            raise argparse.ArgumentTypeError(f"unknown scenario '{name}'")
+        mix[name] = float(weight or 1)
+    return mix
+
+
+def run_command(args):
+    test = LoadTest(args.base_url, args.users, args.mix)
+    random.seed(args.seed)
+    asyncio.run(test.warm_up())
+    print(f"🚦 {args.rps} rps for {args.duration}s against {args.base_url} ({args.users} users)")
+    elapsed = asyncio.run(test.run(args.rps, args.duration))
+
+    endpoints = {name: summarize(test.samples[name], test.errors[name], elapsed) for name in test.mix}
+    all_samples = [s for samples in test.samples.values() for s in samples]
+    report = {
+        "meta": {
+            "revision": git_revision(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "base_url": args.base_url,
+            "target_rps": args.rps,
+            "duration_s": args.duration,
+            "elapsed_s": round(elapsed, 3),
+            "users": args.users,
+            "mix": test.mix,
+            "seed": args.seed,
+        },
+        "endpoints": endpoints,
+        "overall": summarize(all_samples, sum(test.errors.values()), elapsed),
+    }
+
+    print(f"\n{'endpoint':<10} {'count':>7} {'err':>5} {'rps':>8} {'p50':>9} {'p95':>9} {'p99':>9}")
+    for name, stats in [*endpoints.items(), ("overall", report["overall"])]:
+        print(
+            f"{name:<10} {stats['count']:>7} {stats['errors']:>5} {stats['throughput_rps']:>8} "
+            + " ".join(f"{stats[f'p{p}_ms'] if stats[f'p{p}_ms'] is not None else '-':>9}" for p in PERCENTILES)
+        )
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\n💾 Results written to {args.out}")
+    return 0
+
+
+def compare_command(args):
+    with open(args.before, "r", encoding="utf-8") as f:
+        before = json.load(f)
+    with open(args.after, "r", encoding="utf-8") as f:
+        after = json.load(f)
+
+    print(f"📊 {before['meta'].get('revision')} → {after['meta'].get('revision')}")
+    metrics = [f"p{p}_ms" for p in PERCENTILES] + ["throughput_rps", "errors"]
+    for name in [*after["endpoints"], "overall"]:
+        old = before["endpoints"].get(name) if name != "overall" else before["overall"]
+        new = after["endpoints"].get(name) if name != "overall" else after["overall"]
+        if not old or not new:
+            continue
+        cells = []
+        for metric in metrics:
+            a, b = old.get(metric), new.get(metric)
+            if a is None or b is None:
+                cells.append(f"{metric}=-")
+            elif a:
+                cells.append(f"{metric}={b} ({(b - a) / a * 100:+.1f}%)")
+            else:
+                cells.append(f"{metric}={b}")
+        print(f"   {name:<9} " + "  ".join(cells))
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the checkout and orders API routes")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="drive the API at a target request rate")
+    run.add_argument("--base-url", default="http://127.0.0.1:3000")
+    run.add_argument("--rps", type=float, default=20.0)
+    run.add_argument("--duration", type=float, default=30.0, help="seconds")
+    run.add_argument("--users", type=int, default=20, help="must not exceed the stub's --users")
+    run.add_argument("--mix", type=parse_mix, default=parse_mix(DEFAULT_MIX), help=f"default {DEFAULT_MIX}")
+    run.add_argument("--seed", type=int, default=1)
+    run.add_argument("--out", help="write machine-readable results here")
+    run.set_defaults(handler=run_command)
+
+    compare = commands.add_parser("compare", help="diff two result files")
+    compare.add_argument("before")
+    compare.add_argument("after")
+    compare.set_defaults(handler=compare_command)
+
+    args = parser.parse_args()
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,188 @@
+import argparse
+import json
+import random
+import sys
+import time
+from itertools import repeat
+from operator import itemgetter
+
+import numpy as np
+
+from compile_catalog import compiled_path, load_catalog
+
+# Server-side cart pricing from compact (id, quantity) lines.
+#
+# /api/checkout currently trusts the client's totalAmount and stores whole
+# CartItem objects (product + quantity) in orders.items. This engine looks
+# prices up in the compiled catalog, applies `discount` across the whole cart
+# in one vectorised pass, and returns a slim order with only ids, quantities
+# and the prices actually charged.
+#
+# Money is computed in integer paise: each unit price is rounded once, then
+# multiplied out, so line totals always add up to the order total exactly.
+#
+#   python pricing.py '[["6", 2], ["9", 5]]'
+#   python pricing.py bench --lines 5000
+
+
+class PricingError(ValueError):
+    pass
+
+
+class PricingEngine:
+    def __init__(self, catalog):
+        products = catalog["products"]
+        self.ids = [p["id"] for p in products]
+        self.id_array = np.array(self.ids, dtype=object)
+        self.positions = catalog["byId"]
+        prices = np.array([p["price"] for p in products], dtype=np.float64)
+        discounts = np.array([p["discount"] for p in products], dtype=np.float64)
+        # Discounted unit price per catalog position, rounded once to paise
+        self.unit_paise = np.rint(prices * 100 * (1 - discounts / 100)).astype(np.int64)
+
+    def price(self, lines):
+        """Price [(id, quantity), ...]; repeated ids are merged into one line."""
+        if not lines:
+            raise PricingError("Cart is empty")
+        # Split the lines into columns once; everything after works on arrays
+        product_ids = list(map(str, map(itemgetter(0), lines)))
+        raw_quantities = list(map(itemgetter(1), lines))
+
+        positions = np.fromiter(map(self.positions.get, product_ids, repeat(-1)), dtype=np.int64, count=len(lines))
+        unknown = positions < 0
+        if unknown.any():
+            raise PricingError(f"Unknown product id {product_ids[unknown.argmax()]!r}")
+
+        # Checked by type (only the distinct ones, usually just int) before NumPy
+        # sees them: the array would fold True into 1 and trip over nested lists.
+        # Ints too large for int64 still come out as an object array.
+        if not all(issubclass(kind, (int, np.integer)) and kind is not bool for kind in set(map(type, raw_quantities))):
+            raise PricingError("Quantities must be positive integers")
+        quantities = np.array(raw_quantities)
+        if quantities.dtype.kind not in "iu" or not (quantities > 0).all():
+            raise PricingError("Quantities must be positive integers")
+
+        merged, inverse = np.unique(positions, return_inverse=True)
+        merged_quantities = np.zeros(len(merged), dtype=np.int64)
+        np.add.at(merged_quantities, inverse, quantities)
+
+        unit = self.unit_paise[merged]
+        line_totals = unit * merged_quantities
+        total = int(line_totals.sum())
+
+        columns = zip(
+            self.id_array[merged].tolist(), merged_quantities.tolist(), (unit / 100).tolist(), (line_totals / 100).tolist()
+        )
+        return {
+            "items": [{"id": i, "quantity": q, "unitPrice": u, "lineTotal": t} for i, q, u, t in columns],
+            "total_amount": total / 100,
+        }
+
+    def price_python(self, lines):
+        """Pure-Python reference implementation, used by the benchmark."""
+        merged = {}
+        for product_id, quantity in lines:
+            position = self.positions[str(product_id)]
+            merged[position] = merged.get(position, 0) + quantity
+        items = []
+        total = 0
+        for position in sorted(merged):
+            unit = int(self.unit_paise[position])
+            line_total = unit * merged[position]
+            total += line_total
+            items.append({"id": self.ids[position], "quantity": merged[position], "unitPrice": unit / 100, "lineTotal": line_total / 100})
+        return {"items": items, "total_amount": total / 100}
+
+
+def check_client_total(priced, client_total, tolerance=0.01):
+    """True when the client's totalAmount matches the recomputed one."""
+    return client_total is not None and abs(priced["total_amount"] - float(client_total)) <= tolerance
+
+
+# --- BENCHMARK ---
+def legacy_row(catalog, lines, shipping_address):
+    # What /api/checkout stores today: the full CartItem for every line
+    products = {p["id"]: p for p in catalog["products"]}
+    items = [{**products[product_id], "quantity": quantity} for product_id, quantity in lines]
+    total = sum(i["price"] * (1 - i["discount"] / 100) * i["quantity"] for i in items)
+    return {"user_email": "wholesale@example.com", "items": items, "total_amount": total,
+            "shipping_address": shipping_address, "status": "pending"}
+
+
+def best_of(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def bench_command(args):
+    catalog = load_catalog(args.catalog)
+    engine = PricingEngine(catalog)
+    rng = random.Random(args.seed)
+    ids = list(catalog["byId"])
+    # The cart already merges repeated products, so every line is a distinct id;
+    # use a larger compiled catalog (--catalog) to bench carts beyond its size
+    lines = [(product_id, rng.randint(1, 50)) for product_id in rng.sample(ids, min(args.lines, len(ids)))]
+    address = {"doorNo": "12", "area": "Mylapore", "city": "Chennai", "state": "Tamil Nadu", "country": "India", "zip": "600004"}
+
+    legacy = legacy_row(catalog, lines, address)
+    slim = {**engine.price(lines), "user_email": legacy["user_email"], "shipping_address": address, "status": "pending"}
+    legacy_bytes = len(json.dumps(legacy).encode("utf-8"))
+    slim_bytes = len(json.dumps(slim).encode("utf-8"))
+
+    results = {
+        "lines": len(lines),
+        "row_bytes": {"legacy": legacy_bytes, "slim": slim_bytes},
+        "serialize_ms": {
+            "legacy": round(best_of(lambda: json.dumps(legacy), args.repeat) * 1000, 3),
+            "slim": round(best_of(lambda: json.dumps(slim), args.repeat) * 1000, 3),
+        },
+        "price_ms": {
+            "numpy": round(best_of(lambda: engine.price(lines), args.repeat) * 1000, 3),
+            "python": round(best_of(lambda: engine.price_python(lines), args.repeat) * 1000, 3),
+        },
+    }
+    assert engine.price(lines) == engine.price_python(lines)
+
+    print(f"🧾 Wholesale cart with {len(lines)} lines")
+    print(f"   order row   {legacy_bytes:>10,} B → {slim_bytes:>10,} B ({slim_bytes / legacy_bytes:.1%})")
+    print(f"   serialize   {results['serialize_ms']['legacy']:>10} ms → {results['serialize_ms']['slim']:>10} ms")
+    print(f"   pricing     python {results['price_ms']['python']} ms, numpy {results['price_ms']['numpy']} ms")
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"💾 Results written to {args.out}")
+    return 0
+
+
+def price_command(args):
+    lines = json.loads(args.lines)
+    try:
+        priced = PricingEngine(load_catalog()).price([(str(i), q) for i, q in lines])
+    except PricingError as error:
+        print(f"❌ {error}", file=sys.stderr)
+        return 1
+    print(json.dumps(priced, indent=2))
+    return 0
+
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == "bench":
+        parser = argparse.ArgumentParser(prog="pricing.py bench", description="Benchmark slim vs legacy order rows")
+        parser.add_argument("--lines", type=int, default=5000)
+        parser.add_argument("--repeat", type=int, default=5)
+        parser.add_argument("--seed", type=int, default=1)
+        parser.add_argument("--catalog", default=compiled_path, help="compiled catalog to draw products from")
+        parser.add_argument("--out", help="write machine-readable results here")
+        return bench_command(parser.parse_args(sys.argv[2:]))
+
+    parser = argparse.ArgumentParser(description="Price a cart of [id, quantity] lines")
+    parser.add_argument("lines", help='JSON list, e.g. \'[["6", 2], ["9", 5]]\'')
+    return price_command(parser.parse_args())
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,256 @@
+import html
+import json
+import mmap
+import os
+import re
+import struct
+import sys
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+
+from build_output import atomic_path, chunk_size
+from build_profile import BuildReport
+
+# Renders every data/descriptions/{id}.md once into sanitized HTML, a plain-text
+# excerpt for <meta>, a heading table of contents and a word count, and packs
+# them into one id-indexed artifact so product pages never parse markdown per request.
+descriptions_dir = "data/descriptions"
+pack_path = "data/descriptions.pack"
+
+# --- PACK FORMAT ---
+# header : magic(4s) version(H) count(I) ids_size(I)
+# index  : count x [id_offset(I) id_len(H) offset(I) length(I)], sorted by UTF-8 id
+# ids    : the ids, concatenated (referenced by id_offset/id_len)
+# body   : one compact UTF-8 JSON record per id, at `offset` from the body start
+# Index entries are fixed width, so a lookup bisects them in place instead of
+# decoding the whole index.
+PACK_MAGIC = b"FSDP"
+PACK_VERSION = 2
+HEADER = struct.Struct("<4sH2xII")
+ENTRY = struct.Struct("<IHII")
+
+EXCERPT_LENGTH = 160
+
+HEADING_RE = re.compile(r"^(#{1,6})\s+(.*)$")
+BULLET_RE = re.compile(r"^\s*[*-]\s+(.*)$")
+NUMBERED_RE = re.compile(r"^\s*\d+\.\s+(.*)$")
+BOLD_RE = re.compile(r"\*\*(.+?)\*\*")
+ITALIC_RE = re.compile(r"\*(.+?)\*")
+WORD_RE = re.compile(r"\w+(?:['’-]\w+)*")
+
+
+def slugify(text):
+    slug = re.sub(r"[^\w\s-]", "", text.lower())
+    return re.sub(r"[\s_-]+", "-", slug).strip("-")
+
+
+def render_inline(text):
+    # Escape first, then re-introduce the only markup we allow (bold/italic).
+    # Anything else in the source, including raw HTML, ends up as text.
+    escaped = html.escape(text, quote=True)
+    escaped = BOLD_RE.sub(r"<strong>\1</strong>", escaped)
+    return ITALIC_RE.sub(r"<em>\1</em>", escaped)
+
+
+def strip_inline(text):
+    return ITALIC_RE.sub(r"\1", BOLD_RE.sub(r"\1", text))
+
+
+def render_markdown(source):
+    parts = []
+    toc = []
+    plain = []
+    paragraph = []
+    list_tag = None
+    used_slugs = {}
+
+    def close_paragraph():
+        if paragraph:
+            text = " ".join(paragraph)
+            parts.append(f"<p>{render_inline(text)}</p>")
+            plain.append(strip_inline(text))
+            paragraph.clear()
+
+    def close_list():
+        nonlocal list_tag
+        if list_tag:
+            parts.append(f"</{list_tag}>")
+            list_tag = None
+
+    def open_list(tag):
+        nonlocal list_tag
+        if list_tag != tag:
+            close_list()
+            parts.append(f"<{tag}>")
+            list_tag = tag
+
+    for raw_line in source.splitlines():
+        line = raw_line.rstrip()
+        if not line.strip():
+            close_paragraph()
+            close_list()
+            continue
+
+        heading = HEADING_RE.match(line)
+        if heading:
+            close_paragraph()
+            close_list()
+            level = len(heading.group(1))
+            text = heading.group(2).strip()
+            slug = slugify(strip_inline(text)) or "section"
+            # Keep anchors unique when two headings share a title
+            seen = used_slugs.get(slug, 0)
+            used_slugs[slug] = seen + 1
+            if seen:
+                slug = f"{slug}-{seen}"
+            parts.append(f'<h{level} id="{slug}">{render_inline(text)}</h{level}>')
+            toc.append({"level": level, "text": strip_inline(text), "id": slug})
+            continue
+
+        bullet = BULLET_RE.match(line)
+        numbered = None if bullet else NUMBERED_RE.match(line)
+        if bullet or numbered:
+            close_paragraph()
+            open_list("ul" if bullet else "ol")
+            text = (bullet or numbered).group(1).strip()
+            parts.append(f"<li>{render_inline(text)}</li>")
+            plain.append(strip_inline(text))
+            continue
+
+        close_list()
+        paragraph.append(line.strip())
+
+    close_paragraph()
+    close_list()
+
+    body_text = " ".join(plain)
+    return {
+        "html": "".join(parts),
+        "excerpt": make_excerpt(body_text),
+        "toc": toc,
+        "wordCount": len(WORD_RE.findall(source.replace("*", " ").replace("#", " "))),
+    }
+
+
+def make_excerpt(text, limit=EXCERPT_LENGTH):
+    text = " ".join(text.split())
+    if len(text) <= limit:
+        return text
+    cut = text[:limit].rsplit(" ", 1)[0].rstrip(",;:.–-")
+    return f"{cut}…"
+
+
+def render_file(file_name):
+    product_id = os.path.splitext(file_name)[0]
+    with open(os.path.join(descriptions_dir, file_name), "rb") as f:
+        source = f.read()
+    record = render_markdown(source.decode("utf-8"))
+    return product_id, json.dumps(record, ensure_ascii=False, separators=(",", ":")).encode("utf-8"), len(source)
+
+
+def write_pack(path, records):
+    index = bytearray()
+    ids = bytearray()
+    body = bytearray()
+    for encoded_id, product_id in sorted((product_id.encode("utf-8"), product_id) for product_id in records):
+        payload = records[product_id]
+        index += ENTRY.pack(len(ids), len(encoded_id), len(body), len(payload))
+        ids += encoded_id
+        body += payload
+
+    with atomic_path(path) as tmp_path:
+        with open(tmp_path, "wb") as f:
+            f.write(HEADER.pack(PACK_MAGIC, PACK_VERSION, len(records), len(ids)))
+            f.write(index)
+            f.write(ids)
+            f.write(body)
+    return HEADER.size + len(index) + len(ids) + len(body)
+
+
+class DescriptionPack:
+    """Memory-mapped reader; open once and reuse it for every lookup."""
+
+    def __init__(self, path=pack_path):
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.count, ids_size = HEADER.unpack_from(self._map, 0)
+        if magic != PACK_MAGIC or version != PACK_VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a v{PACK_VERSION} description pack; rerun render_descriptions.py")
+        self._ids = HEADER.size + self.count * ENTRY.size
+        self._body = self._ids + ids_size
+
+    def close(self):
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, i):
+        # Sequence of ids for bisect
+        id_offset, id_len, _, _ = ENTRY.unpack_from(self._map, HEADER.size + i * ENTRY.size)
+        return self._map[self._ids + id_offset:self._ids + id_offset + id_len]
+
+    def get(self, product_id):
+        """Return the rendered record for one product, or None if it has no description."""
+        key = str(product_id).encode("utf-8")
+        i = bisect_left(self, key)
+        if i == self.count or self[i] != key:
+            return None
+        _, _, offset, length = ENTRY.unpack_from(self._map, HEADER.size + i * ENTRY.size)
+        start = self._body + offset
+        return json.loads(self._map[start:start + length].decode("utf-8"))
+
+
+_open_packs = {}
+
+
+def read_description(product_id, path=pack_path):
+    """One-off lookup; reuses the mapped pack until the file is rebuilt."""
+    stat = os.stat(path)
+    version = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+    cached = _open_packs.get(path)
+    if cached is None or cached[0] != version:
+        if cached:
+            cached[1].close()
+        cached = _open_packs[path] = (version, DescriptionPack(path))
+    return cached[1].get(product_id)
+
+
+def build_pack(report, workers=None):
+    with report.stage("scan"):
+        file_names = sorted(name for name in os.listdir(descriptions_dir) if name.endswith(".md"))
+
+    with report.stage("render") as stage:
+        records = {}
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for product_id, payload, source_size in pool.map(
+                render_file, file_names, chunksize=chunk_size(len(file_names), workers)
+            ):
+                records[product_id] = payload
+                stage.read(source_size)
+
+    with report.stage("pack") as stage:
+        size = write_pack(pack_path, records)
+        stage.wrote(pack_path, size)
+
+    return len(records), size
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        # Inspect a single record: python render_descriptions.py <id>
+        record = read_description(sys.argv[1])
+        print(json.dumps(record, indent=2, ensure_ascii=False) if record else f"⚠️ No description for {sys.argv[1]}")
+        sys.exit(0 if record else 1)
+
+    report = BuildReport("description-pack")
+    count, size = build_pack(report)
+    print(f"✅ Packed {count} rendered descriptions into {pack_path} ({size} bytes)\n")
+    report.finish()
@@ -0,0 +1,327 @@
+import functools
+import heapq
+import json
+import math
+import os
+import re
+import struct
+import sys
+import time
+import unicodedata
+import zlib
+from bisect import bisect_left
+
+from build_output import atomic_path
+from build_profile import BuildReport
+from compile_catalog import compiled_path, load_catalog
+
+# Offline full-text index over product names, tags, short descriptions and the
+# long markdown in data/descriptions/. BM25 weights are computed at build time
+# and stored per posting, so a query only sums the posting lists of its terms.
+# Those lists are summed in full, so latency grows with the catalog: on a
+# generated 100k-product catalog a warm one-term query takes about 2 ms, two
+# terms 5-7 ms, and a search-as-you-type prefix ("marigold str", up to
+# PREFIX_EXPANSIONS lists) about 17 ms. Building that index takes about 30 s.
+#
+#   python search_index.py                 build data/search.index
+#   python search_index.py "mullai garland" query it
+descriptions_dir = "data/descriptions"
+index_path = "data/search.index"
+
+INDEX_MAGIC = b"FSSI"
+INDEX_VERSION = 1
+HEADER = struct.Struct("<4sHI")
+
+FIELD_WEIGHTS = {"name": 3.0, "tags": 2.0, "description": 1.0, "long": 1.0}
+BM25_K1 = 1.2
+BM25_B = 0.75
+WEIGHT_SCALE = 256  # weights are stored as fixed-point varints
+
+PREFIX_EXPANSIONS = 20
+FUZZY_CANDIDATES = 3
+FUZZY_MIN_SIMILARITY = 0.4
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# Spelling variants that show up when South Indian flower names are romanised,
+# e.g. Vazhai/Valai, Mullai/Mullay, Sevvanthi/Sevanti
+TRANSLITERATION_RULES = [
+    ("zh", "l"), ("bh", "b"), ("dh", "d"), ("gh", "g"), ("jh", "j"), ("kh", "k"),
+    ("th", "t"), ("sh", "s"), ("ph", "f"), ("w", "v"), ("ee", "i"), ("oo", "u"),
+]
+REPEATS_RE = re.compile(r"(.)\1+")
+
+
+# --- TEXT NORMALISATION ---
+def strip_diacritics(text):
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+
+
+# Catalog text repeats a small vocabulary, so each distinct token is folded once
+@functools.lru_cache(maxsize=65536)
+def fold(token):
+    for source, target in TRANSLITERATION_RULES:
+        token = token.replace(source, target)
+    token = REPEATS_RE.sub(r"\1", token)
+    if len(token) > 2 and token.endswith("ay"):
+        token = token[:-1] + "i"
+    return token
+
+
+def tokenize(text):
+    return [fold(token) for token in TOKEN_RE.findall(strip_diacritics(text).lower())]
+
+
+def trigrams(term):
+    padded = f"  {term} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+# --- VARINTS ---
+def write_varint(out, value):
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def read_varints(data, start, end):
+    values = []
+    value = shift = 0
+    for byte in data[start:end]:
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+        else:
+            values.append(value)
+            value = shift = 0
+    return values
+
+
+def encode_postings(pairs):
+    """Delta-encode sorted (doc, weight) pairs as varints."""
+    out = bytearray()
+    previous = 0
+    for doc, weight in pairs:
+        write_varint(out, doc - previous)
+        write_varint(out, weight)
+        previous = doc
+    return out
+
+
+def encode_ids(ids):
+    out = bytearray()
+    previous = 0
+    for value in ids:
+        write_varint(out, value - previous)
+        previous = value
+    return out
+
+
+# --- BUILD ---
+def read_long_description(product_id):
+    path = os.path.join(descriptions_dir, f"{product_id}.md")
+    if not os.path.exists(path):
+        return ""
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def build_index(products):
+    doc_terms = []
+    doc_lengths = []
+    for product in products:
+        fields = {
+            "name": product["name"],
+            "tags": " ".join(product["tags"]),
+            "description": product["description"],
+            "long": read_long_description(product["id"]),
+        }
+        frequencies = {}
+        length = 0.0
+        for field, text in fields.items():
+            weight = FIELD_WEIGHTS[field]
+            for token in tokenize(text):
+                frequencies[token] = frequencies.get(token, 0.0) + weight
+                length += weight
+        doc_terms.append(frequencies)
+        doc_lengths.append(length)
+
+    doc_count = len(products)
+    average_length = (sum(doc_lengths) / doc_count) if doc_count else 0.0
+
+    postings = {}
+    for doc, frequencies in enumerate(doc_terms):
+        for term, tf in frequencies.items():
+            postings.setdefault(term, []).append((doc, tf))
+
+    terms = sorted(postings)
+    postings_blob = bytearray()
+    postings_offsets = [0]
+    for term in terms:
+        pairs = postings[term]
+        idf = math.log(1 + (doc_count - len(pairs) + 0.5) / (len(pairs) + 0.5))
+        encoded = []
+        for doc, tf in pairs:
+            norm = BM25_K1 * (1 - BM25_B + BM25_B * doc_lengths[doc] / average_length)
+            score = idf * tf * (BM25_K1 + 1) / (tf + norm)
+            encoded.append((doc, max(1, round(score * WEIGHT_SCALE))))
+        postings_blob += encode_postings(encoded)
+        postings_offsets.append(len(postings_blob))
+
+    trigram_terms = {}
+    for term_id, term in enumerate(terms):
+        for gram in trigrams(term):
+            trigram_terms.setdefault(gram, []).append(term_id)
+    grams = sorted(trigram_terms)
+    trigram_blob = bytearray()
+    trigram_offsets = [0]
+    for gram in grams:
+        trigram_blob += encode_ids(trigram_terms[gram])
+        trigram_offsets.append(len(trigram_blob))
+
+    meta = {
+        "ids": [p["id"] for p in products],
+        "terms": terms,
+        "postingsOffsets": postings_offsets,
+        "trigrams": grams,
+        "trigramOffsets": trigram_offsets,
+    }
+    return meta, bytes(postings_blob), bytes(trigram_blob)
+
+
+def write_index(path, meta, postings_blob, trigram_blob):
+    meta_bytes = json.dumps(meta, separators=(",", ":")).encode("utf-8")
+    payload = zlib.compress(meta_bytes + postings_blob + trigram_blob, 9)
+    with atomic_path(path) as tmp_path:
+        with open(tmp_path, "wb") as f:
+            f.write(HEADER.pack(INDEX_MAGIC, INDEX_VERSION, len(meta_bytes)))
+            f.write(struct.pack("<I", len(postings_blob)))
+            f.write(payload)
+    return HEADER.size + 4 + len(payload)
+
+
+# --- QUERY ENGINE ---
+class SearchIndex:
+    def __init__(self, meta, postings_blob, trigram_blob):
+        self.ids = meta["ids"]
+        self.terms = meta["terms"]
+        self.term_ids = {term: i for i, term in enumerate(self.terms)}
+        self.postings_offsets = meta["postingsOffsets"]
+        self.trigram_ids = {gram: i for i, gram in enumerate(meta["trigrams"])}
+        self.trigram_offsets = meta["trigramOffsets"]
+        self.postings_blob = postings_blob
+        self.trigram_blob = trigram_blob
+        self._postings_cache = {}
+
+    @classmethod
+    def load(cls, path=index_path):
+        with open(path, "rb") as f:
+            magic, version, meta_length = HEADER.unpack(f.read(HEADER.size))
+            if magic != INDEX_MAGIC or version != INDEX_VERSION:
+                raise ValueError(f"{path} is not a v{INDEX_VERSION} search index")
+            (postings_length,) = struct.unpack("<I", f.read(4))
+            payload = zlib.decompress(f.read())
+        meta = json.loads(payload[:meta_length].decode("utf-8"))
+        postings_end = meta_length + postings_length
+        return cls(meta, payload[meta_length:postings_end], payload[postings_end:])
+
+    def postings(self, term_id):
+        cached = self._postings_cache.get(term_id)
+        if cached is None:
+            values = read_varints(self.postings_blob, self.postings_offsets[term_id], self.postings_offsets[term_id + 1])
+            cached = []
+            doc = 0
+            for delta, weight in zip(values[::2], values[1::2]):
+                doc += delta
+                cached.append((doc, weight / WEIGHT_SCALE))
+            self._postings_cache[term_id] = cached
+        return cached
+
+    def prefix_terms(self, prefix, limit=PREFIX_EXPANSIONS):
+        start = bisect_left(self.terms, prefix)
+        matches = []
+        for term_id in range(start, min(start + limit, len(self.terms))):
+            if not self.terms[term_id].startswith(prefix):
+                break
+            matches.append(term_id)
+        return matches
+
+    def fuzzy_terms(self, token, limit=FUZZY_CANDIDATES):
+        grams = trigrams(token)
+        shared = {}
+        for gram in grams:
+            gram_id = self.trigram_ids.get(gram)
+            if gram_id is None:
+                continue
+            term_id = 0
+            for delta in read_varints(self.trigram_blob, self.trigram_offsets[gram_id], self.trigram_offsets[gram_id + 1]):
+                term_id += delta
+                shared[term_id] = shared.get(term_id, 0) + 1
+
+        scored = []
+        for term_id, overlap in shared.items():
+            # Jaccard similarity on padded trigrams; the term's own trigram count
+            # is len(term) + 1 for padded terms (ignoring repeats, close enough)
+            union = len(grams) + len(self.terms[term_id]) + 1 - overlap
+            similarity = overlap / union
+            if similarity >= FUZZY_MIN_SIMILARITY:
+                scored.append((similarity, term_id))
+        scored.sort(reverse=True)
+        return [(term_id, similarity) for similarity, term_id in scored[:limit]]
+
+    def expand(self, token, is_last):
+        """Map one query token to [(term_id, boost)]: exact, then prefix, then fuzzy."""
+        exact = self.term_ids.get(token)
+        if exact is not None and not is_last:
+            return [(exact, 1.0)]
+        expansions = [] if exact is None else [(exact, 1.0)]
+        if is_last:
+            # Search-as-you-type: the token being typed also matches longer terms
+            expansions += [(term_id, 0.8) for term_id in self.prefix_terms(token) if term_id != exact]
+        if not expansions:
+            expansions = [(term_id, 0.7 * similarity) for term_id, similarity in self.fuzzy_terms(token)]
+        return expansions
+
+    def search(self, query, limit=10):
+        tokens = tokenize(query)
+        scores = {}
+        get = scores.get
+        for position, token in enumerate(tokens):
+            for term_id, boost in self.expand(token, position == len(tokens) - 1):
+                for doc, weight in self.postings(term_id):
+                    scores[doc] = get(doc, 0.0) + weight * boost
+        # Only the top `limit` are wanted; no need to sort every matching document
+        ranked = heapq.nsmallest(limit, scores.items(), key=lambda item: (-item[1], item[0]))
+        return [(self.ids[doc], round(score, 4)) for doc, score in ranked]
+
+
+def main():
+    if len(sys.argv) > 1:
+        index = SearchIndex.load()
+        query = " ".join(sys.argv[1:])
+        index.search(query)  # warm the postings cache
+        started = time.perf_counter()
+        results = index.search(query)
+        elapsed = (time.perf_counter() - started) * 1_000_000
+        for product_id, score in results:
+            print(f"   {product_id:>6}  {score:8.3f}")
+        print(f"\n🔎 {len(results)} result(s) for {query!r} in {elapsed:.0f} µs")
+        return
+
+    report = BuildReport("search-index")
+    with report.stage("read") as stage:
+        products = load_catalog()["products"]
+        stage.read(os.path.getsize(compiled_path))
+    with report.stage("index"):
+        meta, postings_blob, trigram_blob = build_index(products)
+    with report.stage("write") as stage:
+        size = write_index(index_path, meta, postings_blob, trigram_blob)
+        stage.wrote(index_path, size)
+    print(f"✅ Indexed {len(products)} products, {len(meta['terms'])} terms into {index_path} ({size} bytes)\n")
+    report.finish()
+
+
+if __name__ == "__main__":
+    main()
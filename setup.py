@@ -1,5 +1,7 @@
 import os
 
+from build_profile import BuildReport
+
 # Define the perfect project structure
 # 'data' goes in Root. Everything else goes in 'src'.
 structure = {
@@ -74,34 +76,41 @@ structure = {
 def create_project_structure():
     print("🚀 Starting Project Scaffolding for 'src/' directory...")
     base_path = os.getcwd()
+    report = BuildReport("scaffold")
+
+    with report.stage("scaffold") as stage:
+        for folder, files in structure.items():
+            # Create the folder path
+            full_folder_path = os.path.join(base_path, folder)
+
+            try:
+                os.makedirs(full_folder_path, exist_ok=True)
+                print(f"✅ Folder: {folder}")
+            except Exception as e:
+                print(f"❌ Error creating folder {folder}: {e}")
+                stage.error(f"folder {folder}: {e}")
+                continue
 
-    for folder, files in structure.items():
-        # Create the folder path
-        full_folder_path = os.path.join(base_path, folder)
-        
-        try:
-            os.makedirs(full_folder_path, exist_ok=True)
-            print(f"✅ Folder: {folder}")
-        except Exception as e:
-            print(f"❌ Error creating folder {folder}: {e}")
-            continue
+            # Create the files inside the folder
+            for filename, initial_content in files:
+                file_path = os.path.join(full_folder_path, filename)
 
-        # Create the files inside the folder
-        for filename, initial_content in files:
-            file_path = os.path.join(full_folder_path, filename)
-            
-            # Only create if it doesn't exist (to prevent overwriting work)
-            if not os.path.exists(file_path):
-                try:
-                    with open(file_path, "w", encoding="utf-8") as f:
-                        f.write(initial_content)
-                    print(f"   📄 Created: {filename}")
-                except Exception as e:
-                    print(f"   ❌ Error creating file {filename}: {e}")
-            else:
-                print(f"   ⚠️ Skipped (already exists): {filename}")
+                # Only create if it doesn't exist (to prevent overwriting work)
+                if not os.path.exists(file_path):
+                    try:
+                        with open(file_path, "w", encoding="utf-8") as f:
+                            f.write(initial_content)
+                        stage.wrote(file_path, len(initial_content.encode("utf-8")))
+                        print(f"   📄 Created: {filename}")
+                    except Exception as e:
+                        print(f"   ❌ Error creating file {filename}: {e}")
+                        stage.error(f"file {file_path}: {e}")
+                else:
+                    stage.skipped()
+                    print(f"   ⚠️ Skipped (already exists): {filename}")
 
     print("\n✨ Scaffolding Complete! You can now start copy-pasting code.")
+    report.finish()
 
 if __name__ == "__main__":
     create_project_structure()
\ No newline at end of file
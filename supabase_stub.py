@@ -0,0 +1,300 @@
+import argparse
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+
+# A local stand-in for the Supabase REST (PostgREST) endpoints the API routes
+# use, with configurable latency, so checkout/orders can be load tested
+# without touching the real project.
+#
+#   python supabase_stub.py --port 54321 --latency-ms 40 --jitter-ms 15
+#   NEXT_PUBLIC_SUPABASE_URL=http://127.0.0.1:54321 NEXT_PUBLIC_SUPABASE_ANON_KEY=stub npm run start
+#
+# Supported: GET/POST/PATCH on /rest/v1/{table}, eq/neq/gt/gte/lt/lte/in
+# filters, or=(...), select, order, limit, offset, Prefer: return=representation,
+# on_conflict + Prefer: resolution=ignore-duplicates on inserts, and the
+# single-object Accept header used by .single(). Anything else (an unknown
+# operator, malformed JSON) gets PostgREST's 400 error body back.
+
+# Every seeded user shares this password; the hash is bcrypt(cost 10) of it
+LOADTEST_PASSWORD = "loadtest-password"
+LOADTEST_PASSWORD_HASH = "$2b$10$TpMRRPLsZbMuHbVvLRLMquxmoGL.TxaoKfvpD.dtu3eFx5v3ijljS"
+
+OBJECT_MEDIA_TYPE = "application/vnd.pgrst.object+json"
+FILTER_RE = re.compile(r"^(eq|neq|gt|gte|lt|lte|in)\.(.*)$", re.S)
+
+
+def seed_user(i):
+    return {
+        "id": str(uuid.UUID(int=i + 1)),
+        "email": f"loadtest+{i}@example.com",
+        "password": LOADTEST_PASSWORD_HASH,
+        "name": f"Load Test {i}",
+        "role": "customer",
+        "phone": f"9{i:09d}",
+        "address": {
+            "doorNo": str(i),
+            "area": "Test Nagar",
+            "city": "Chennai",
+            "state": "Tamil Nadu",
+            "country": "India",
+            "zip": f"600{i % 1000:03d}",
+        },
+    }
+
+
+class RequestError(ValueError):
+    def __init__(self, code, message):
+        super().__init__(message)
+        self.code = code
+
+
+class Store:
+    def __init__(self, user_count):
+        self.lock = threading.Lock()
+        self.tables = {"users": [seed_user(i) for i in range(user_count)], "orders": []}
+
+
+# --- FILTERING (a small subset of PostgREST's query grammar) ---
+def coerce(value, current):
+    if isinstance(current, bool):
+        return value == "true"
+    if isinstance(current, (int, float)):
+        try:
+            return type(current)(value)
+        except ValueError:
+            return value
+    return value
+
+
+def matches(row, column, expression):
+    match = FILTER_RE.match(expression)
+    if not match:
+        raise RequestError("PGRST100", f"unsupported filter {column}={expression}")
+    op, raw = match.groups()
+    current = row.get(column)
+    if op == "in":
+        options = [coerce(v.strip().strip('"'), current) for v in raw.strip("()").split(",")]
+        return current in options
+    value = coerce(raw, current)
+    if current is None:
+        return op == "neq" and value != "null"
+    return {
+        "eq": current == value,
+        "neq": current != value,
+        "gt": current > value,
+        "gte": current >= value,
+        "lt": current < value,
+        "lte": current <= value,
+    }[op]
+
+
+def split_top_level(text):
+    parts, depth, start = [], 0, 0
+    for i, ch in enumerate(text):
+        if ch == "(":
+            depth += 1
+        elif ch == ")":
+            depth -= 1
+        elif ch == "," and depth == 0:
+            parts.append(text[start:i])
+            start = i + 1
+    parts.append(text[start:])
+    return parts
+
+
+def matches_logic(row, combinator, body):
+    """Evaluate or=(a.op.v,and(b.op.v,c.op.v)) style expressions."""
+    results = []
+    for term in split_top_level(body.strip()[1:-1]):
+        if term.startswith(("and(", "or(")):
+            inner = term.index("(")
+            results.append(matches_logic(row, term[:inner], term[inner:]))
+        else:
+            column, expression = term.split(".", 1)
+            results.append(matches(row, column, expression))
+    return any(results) if combinator == "or" else all(results)
+
+
+def apply_query(rows, params):
+    selected = None
+    order = []
+    limit = offset = None
+    for key, value in params:
+        if key == "select":
+            selected = None if value.strip() == "*" else [c.strip() for c in value.split(",")]
+        elif key == "order":
+            order = [part.split(".") for part in value.split(",")]
+        elif key == "limit":
+            limit = int(value)
+        elif key == "offset":
+            offset = int(value)
+        elif key in ("or", "and"):
+            rows = [row for row in rows if matches_logic(row, key, value)]
+        else:
+            rows = [row for row in rows if matches(row, key, value)]
+
+    for column, *flags in reversed(order):
+        rows = sorted(rows, key=lambda row: (row.get(column) is None, row.get(column)), reverse="desc" in flags)
+    if offset:
+        rows = rows[offset:]
+    if limit is not None:
+        rows = rows[:limit]
+    if selected:
+        rows = [{c: row.get(c) for c in selected} for row in rows]
+    return rows
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    store = None
+    latency = 0.0
+    jitter = 0.0
+
+    def log_message(self, *args):
+        pass
+
+    def table_and_params(self):
+        parts = urlsplit(self.path)
+        match = re.match(r"^/rest/v1/(\w+)$", parts.path)
+        if not match or match.group(1) not in self.store.tables:
+            return None, None
+        return match.group(1), parse_qsl(parts.query, keep_blank_values=True)
+
+    def read_body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            return json.loads(self.rfile.read(length) or b"null")
+        except ValueError as error:
+            raise RequestError("PGRST102", f"Empty or invalid json: {error}") from error
+
+    def respond(self, status, payload):
+        if self.latency or self.jitter:
+            time.sleep(max(0.0, self.latency + random.uniform(-self.jitter, self.jitter)))
+        body = b"" if payload is None else json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def respond_rows(self, rows, status=200):
+        if OBJECT_MEDIA_TYPE in (self.headers.get("Accept") or ""):
+            if len(rows) != 1:
+                return self.respond(406, {
+                    "code": "PGRST116",
+                    "message": "JSON object requested, multiple (or no) rows returned",
+                    "details": f"The result contains {len(rows)} rows",
+                    "hint": None,
+                })
+            return self.respond(status, rows[0])
+        return self.respond(status, rows)
+
+    def returns_representation(self):
+        return "return=representation" in (self.headers.get("Prefer") or "")
+
+    def guarded(self, handler):
+        # Errors raised while parsing the request become a 400 instead of a
+        # dropped connection; nothing has been sent yet at that point
+        try:
+            handler()
+        except ValueError as error:
+            self.respond(400, {
+                "code": getattr(error, "code", "PGRST100"),
+                "message": str(error),
+                "details": None,
+                "hint": None,
+            })
+
+    def do_GET(self):
+        self.guarded(self.handle_get)
+
+    def do_POST(self):
+        self.guarded(self.handle_post)
+
+    def do_PATCH(self):
+        self.guarded(self.handle_patch)
+
+    def handle_get(self):
+        table, params = self.table_and_params()
+        if table is None:
+            return self.respond(404, {"message": "not found"})
+        with self.store.lock:
+            rows = apply_query(list(self.store.tables[table]), params)
+        self.respond_rows(rows)
+
+    def handle_post(self):
+        table, params = self.table_and_params()
+        if table is None:
+            return self.respond(404, {"message": "not found"})
+        payload = self.read_body()
+        new_rows = payload if isinstance(payload, list) else [payload]
+        if not all(isinstance(row, dict) for row in new_rows):
+            raise RequestError("PGRST102", "Expected a JSON object or an array of objects")
+        now = datetime.now(timezone.utc).isoformat()
+        conflict_column = dict(params).get("on_conflict", "id")
+        ignore_duplicates = "resolution=ignore-duplicates" in (self.headers.get("Prefer") or "")
+        with self.store.lock:
+            for row in new_rows:
+                row.setdefault("id", str(uuid.uuid4()))
+                row.setdefault("created_at", now)
+            if ignore_duplicates:
+                existing = {row.get(conflict_column) for row in self.store.tables[table]}
+                new_rows = [row for row in new_rows if row.get(conflict_column) not in existing]
+            self.store.tables[table].extend(new_rows)
+        if not self.returns_representation():
+            return self.respond(201, None)
+        self.respond_rows(apply_query(new_rows, [p for p in params if p[0] == "select"]), status=201)
+
+    def handle_patch(self):
+        table, params = self.table_and_params()
+        if table is None:
+            return self.respond(404, {"message": "not found"})
+        updates = self.read_body()
+        if not isinstance(updates, dict):
+            raise RequestError("PGRST102", "Expected a JSON object")
+        filters = [p for p in params if p[0] not in ("select", "order", "limit", "offset")]
+        with self.store.lock:
+            rows = apply_query(self.store.tables[table], filters)
+            for row in rows:
+                row.update(updates)
+        if not self.returns_representation():
+            return self.respond(204, None)
+        self.respond_rows(apply_query(rows, [p for p in params if p[0] == "select"]))
+
+
+def serve(host="127.0.0.1", port=54321, latency_ms=0.0, jitter_ms=0.0, users=100):
+    Handler.store = Store(users)
+    Handler.latency = latency_ms / 1000
+    Handler.jitter = jitter_ms / 1000
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local Supabase REST stand-in for load tests")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=54321)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="added to every response")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="uniform +/- jitter on the latency")
+    parser.add_argument("--users", type=int, default=100, help="seeded loadtest+N@example.com users")
+    args = parser.parse_args()
+
+    server = serve(args.host, args.port, args.latency_ms, args.jitter_ms, args.users)
+    print(f"🧪 Supabase stub on http://{args.host}:{args.port} ({args.users} users, {args.latency_ms}±{args.jitter_ms} ms)")
+    print(f"   Users: loadtest+0..{args.users - 1}@example.com / {LOADTEST_PASSWORD}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n👋 Stub stopped")
+
+
+if __name__ == "__main__":
+    main()
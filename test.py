@@ -1,4 +1,11 @@
+import hashlib
+import json
 import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from build_output import atomic_write, chunk_size
+from build_profile import BuildReport
 
 # Ensure the directory exists
 output_dir = "data/descriptions"
@@ -279,14 +286,95 @@ Assign a family member or a welcome hostess to sprinkle this fragrant blessing o
 *Start your celebration on a fragrant note.*"""
 }
 
-# Generate files
-for product_id, content in products_content.items():
+# --- INCREMENTAL BUILD ---
+# Each description is hashed and compared against a manifest that lives next to
+# the descriptions folder. Only new or changed entries are rewritten, so a no-op
+# rebuild touches nothing on disk and downstream caches stay warm.
+manifest_path = os.path.join(os.path.dirname(output_dir), "descriptions.manifest.json")
+
+
+def content_hash(content):
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def load_manifest(path):
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        # A corrupt manifest just means a full rebuild
+        return {}
+
+
+def hash_entry(entry):
+    product_id, content = entry
+    return product_id, content_hash(content)
+
+
+def write_entry(entry):
+    product_id, content = entry
     file_path = os.path.join(output_dir, f"{product_id}.md")
-    
-    # Write or Overwrite the file
-    with open(file_path, "w", encoding="utf-8") as f:
-        f.write(content)
-    
-    print(f"✅ Generated/Updated: {file_path}")
-
-print("\n🎉 All 16 HIGH-QUALITY RICH DESCRIPTIONS have been generated successfully!")
\ No newline at end of file
+    data = content.encode("utf-8")
+    atomic_write(file_path, data)
+    return file_path, len(data)
+
+
+def build_descriptions(contents, report, workers=None, force=False):
+    # Each parallel stage gets its own pool: workers are only reaped (and their
+    # CPU time only shows up in RUSAGE_CHILDREN) when the pool shuts down, so a
+    # pool shared across stages would bill all worker CPU to the last one.
+
+    # 1. Hash every description
+    with report.stage("hash"):
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            hashes = dict(pool.map(hash_entry, contents.items(), chunksize=chunk_size(len(contents), workers)))
+
+    # 2. Diff against the previous manifest
+    with report.stage("diff") as stage:
+        manifest = {} if force else load_manifest(manifest_path)
+        if not force and os.path.exists(manifest_path):
+            stage.read(os.path.getsize(manifest_path))
+        changed = [
+            product_id for product_id, digest in hashes.items()
+            if manifest.get(product_id) != digest
+            or not os.path.exists(os.path.join(output_dir, f"{product_id}.md"))
+        ]
+
+    # 3. Write only what changed (no pool at all on a no-op rebuild)
+    with report.stage("write") as stage:
+        jobs = [(product_id, contents[product_id]) for product_id in changed]
+        written = []
+        if jobs:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                written = list(pool.map(write_entry, jobs, chunksize=chunk_size(len(jobs), workers)))
+        for file_path, size in written:
+            stage.wrote(file_path, size)
+        stage.skipped(len(hashes) - len(changed))
+
+    # 4. Persist the new manifest (atomically, like the descriptions)
+    with report.stage("manifest") as stage:
+        if hashes != manifest:
+            data = json.dumps(hashes, indent=2, sort_keys=True).encode("utf-8")
+            atomic_write(manifest_path, data)
+            stage.wrote(manifest_path, len(data))
+        else:
+            stage.skipped()
+
+    return written, len(hashes) - len(changed)
+
+
+if __name__ == "__main__":
+    force = "--force" in sys.argv
+    report = BuildReport("descriptions")
+    written, skipped = build_descriptions(products_content, report, force=force)
+
+    for file_path, size in written:
+        print(f"✅ Generated/Updated: {file_path} ({size} bytes)")
+
+    if written:
+        print(f"\n🎉 {len(written)} description(s) rewritten, {skipped} unchanged.\n")
+    else:
+        print(f"\n💤 No-op rebuild: all {skipped} descriptions are up to date.\n")
+    report.finish()